@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+N8N-DevHub - Benchmark: WorkflowModel (sync) vs AsyncWorkflowModel
+Usa um servidor fake local com latência artificial para simular o n8n
+
+Uso: python N8N-DevHub/benchmarks/bench_async_model.py -n 200 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Adicionar o diretório N8N-DevHub ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models.workflow_model import WorkflowModel
+from models.async_workflow_model import AsyncWorkflowModel
+
+
+def start_fake_server(workflow_count: int, latency: float) -> ThreadingHTTPServer:
+    """Sobe servidor HTTP fake que responde como a API de workflows do n8n"""
+    workflows = {
+        f"wf{i:014d}": {
+            'id': f"wf{i:014d}",
+            'name': f"Workflow {i}",
+            'active': False,
+            'nodes': [{'id': 'n1', 'name': 'Start', 'type': 'n8n-nodes-base.manualTrigger', 'parameters': {}}],
+            'connections': {},
+            'createdAt': '2025-01-01T00:00:00.000Z',
+            'updatedAt': '2025-01-01T00:00:00.000Z'
+        }
+        for i in range(workflow_count)
+    }
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            time.sleep(latency)
+            workflow_id = self.path.split('?')[0].rstrip('/').split('/')[-1]
+            if workflow_id == 'workflows':
+                body = {'data': list(workflows.values()), 'nextCursor': None}
+            else:
+                body = workflows.get(workflow_id)
+
+            payload = json.dumps(body).encode()
+            self.send_response(200 if body else 404)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def bench_sync(model: WorkflowModel, workflow_ids) -> float:
+    """Busca detalhes de cada workflow em sequência"""
+    start = time.perf_counter()
+    for workflow_id in workflow_ids:
+        model.get_workflow_by_id(workflow_id)
+    return time.perf_counter() - start
+
+
+async def bench_async(model: WorkflowModel, workflow_ids, concurrency: int) -> float:
+    """Busca detalhes de todos os workflows num único event loop"""
+    async with AsyncWorkflowModel(model, concurrency=concurrency) as async_model:
+        start = time.perf_counter()
+        results = await async_model.get_workflows_by_ids(workflow_ids)
+        elapsed = time.perf_counter() - start
+
+    errors = [r for r in results.values() if isinstance(r, Exception) or r is None]
+    if errors:
+        raise RuntimeError(f"{len(errors)} requisições falharam")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark sync vs async model')
+    parser.add_argument('-n', '--count', type=int, default=200, help='Quantidade de workflows')
+    parser.add_argument('--latency', type=float, default=0.05, help='Latência artificial por requisição (s)')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[10, 50], help='Níveis de concorrência async')
+    args = parser.parse_args()
+
+    server = start_fake_server(args.count, args.latency)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    model = WorkflowModel(base_url=base_url, api_key='benchmark')
+    workflow_ids = [wf.id for wf in model.get_all_workflows()]
+
+    print(f"{len(workflow_ids)} workflows, latência {args.latency * 1000:.0f}ms por requisição\n")
+
+    elapsed = bench_sync(model, workflow_ids)
+    print(f"{'sync (sequencial)':<24} {elapsed:8.2f}s  {len(workflow_ids) / elapsed:8.1f} req/s")
+
+    for concurrency in args.concurrency:
+        elapsed = asyncio.run(bench_async(model, workflow_ids, concurrency))
+        label = f"async (concorrência {concurrency})"
+        print(f"{label:<24} {elapsed:8.2f}s  {len(workflow_ids) / elapsed:8.1f} req/s")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
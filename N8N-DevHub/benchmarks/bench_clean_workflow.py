@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+N8N-DevHub - Benchmark: limpeza do payload de upload (deepcopy vs cópia rasa)
+Compara tempo e pico de memória de _clean_workflow_data em workflows de vários MB
+
+Uso: python N8N-DevHub/benchmarks/bench_clean_workflow.py --nodes 200 --pin-mb 8
+"""
+
+import argparse
+import copy
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Adicionar o diretório N8N-DevHub ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models.workflow_model import WorkflowModel
+
+
+def clean_with_deepcopy(workflow_data: dict) -> dict:
+    """Implementação anterior (cópia profunda do workflow inteiro)"""
+    clean_data = copy.deepcopy(workflow_data)
+    for field in ['id', 'createdAt', 'updatedAt', 'shared', 'versionId', 'meta',
+                  'active', 'tags', 'pinData', 'triggerCount', 'isArchived']:
+        clean_data.pop(field, None)
+    for node in clean_data.get('nodes') or []:
+        if isinstance(node, dict):
+            node.pop('id', None)
+            node.pop('webhookId', None)
+            if isinstance(node.get('credentials'), dict):
+                for cred_data in node['credentials'].values():
+                    if isinstance(cred_data, dict):
+                        cred_data.pop('id', None)
+    return clean_data
+
+
+def build_workflow(node_count: int, pin_mb: float) -> dict:
+    """Workflow com nós Code, credenciais, staticData e pinData volumosos"""
+    code = "\n".join(f"const v{i} = $json.items.map(x => x.valor * {i});" for i in range(60))
+    nodes = [
+        {
+            'id': f"node-{i:05d}",
+            'name': f"Node {i}",
+            'type': 'n8n-nodes-base.code' if i % 3 else 'n8n-nodes-base.httpRequest',
+            'position': [i * 200, 0],
+            'parameters': {'jsCode': code, 'options': {'batching': {'batchSize': i}}},
+            **({'credentials': {'httpHeaderAuth': {'id': f"cred{i}", 'name': 'API'}}} if i % 3 == 0 else {}),
+            **({'webhookId': f"hook-{i}"} if i % 10 == 0 else {})
+        }
+        for i in range(node_count)
+    ]
+
+    row = {'id': 0, 'nome': 'Cliente', 'email': 'cliente@example.com', 'itens': list(range(20))}
+    rows = int(pin_mb * 1024 * 1024 / 200)
+    return {
+        'id': 'benchWorkflow01',
+        'name': 'Benchmark Workflow',
+        'active': True,
+        'nodes': nodes,
+        'connections': {f"Node {i}": {'main': [[{'node': f"Node {i + 1}", 'type': 'main', 'index': 0}]]}
+                        for i in range(node_count - 1)},
+        'settings': {'executionOrder': 'v1'},
+        'staticData': {'lastIds': list(range(rows // 10))},
+        'pinData': {'Node 0': [{'json': dict(row, id=i)} for i in range(rows)]},
+        'updatedAt': '2025-01-01T00:00:00.000Z'
+    }
+
+
+def measure(func, workflow: dict, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(workflow)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    func(workflow)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark da limpeza do payload de upload')
+    parser.add_argument('--nodes', type=int, default=200, help='Quantidade de nós')
+    parser.add_argument('--pin-mb', type=float, default=8, help='Tamanho aproximado de pinData/staticData (MB)')
+    parser.add_argument('--repeat', type=int, default=5, help='Repetições por medição')
+    args = parser.parse_args()
+
+    model = WorkflowModel(base_url='http://127.0.0.1:1', api_key='benchmark')
+    workflow = build_workflow(args.nodes, args.pin_mb)
+
+    # Mesmo payload, original intacto
+    assert model._clean_workflow_data(workflow) == clean_with_deepcopy(workflow)
+    assert workflow['nodes'][0]['id'] == 'node-00000'
+
+    print(f"Workflow: {args.nodes} nós, pinData/staticData ~{args.pin_mb:.0f}MB\n")
+    print(f"{'implementação':<16} {'tempo':>10} {'pico memória':>14}")
+    for label, func in [('deepcopy', clean_with_deepcopy), ('cópia rasa', model._clean_workflow_data)]:
+        elapsed, peak = measure(func, workflow, args.repeat)
+        print(f"{label:<16} {elapsed * 1000:8.2f}ms {peak / 1024 / 1024:11.2f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+N8N-DevHub - Benchmark: json padrão vs utils.json_codec
+Mede leitura, escrita (indent=2) e hash de um workflow sintético com muitos nós Code
+
+Uso: python N8N-DevHub/benchmarks/bench_json_codec.py --nodes 300 --repeat 50
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+
+# Adicionar o diretório N8N-DevHub ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils import json_codec
+
+
+def build_workflow(node_count: int) -> dict:
+    """Workflow grande com nós Code (código extenso, acentos e emojis)"""
+    code = "\n".join(
+        f"const item{i} = $input.all()[{i}].json; // comentário ação {i} ✅\n"
+        f"if (item{i}.valor > {i}) {{ return [{{ json: {{ total: item{i}.valor * 1.5 }} }}]; }}"
+        for i in range(40)
+    )
+    nodes = [
+        {
+            'id': f"node-{i:05d}",
+            'name': f"Code {i}",
+            'type': 'n8n-nodes-base.code',
+            'typeVersion': 2,
+            'position': [i * 220, (i % 7) * 140],
+            'parameters': {'jsCode': code, 'mode': 'runOnceForAllItems'}
+        }
+        for i in range(node_count)
+    ]
+    connections = {
+        f"Code {i}": {'main': [[{'node': f"Code {i + 1}", 'type': 'main', 'index': 0}]]}
+        for i in range(node_count - 1)
+    }
+    return {
+        'id': 'benchWorkflow01',
+        'name': 'Benchmark Workflow',
+        'active': False,
+        'nodes': nodes,
+        'connections': connections,
+        'settings': {'executionOrder': 'v1'},
+        'updatedAt': '2025-01-01T00:00:00.000Z'
+    }
+
+
+def timed(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark json padrão vs json_codec')
+    parser.add_argument('--nodes', type=int, default=300, help='Quantidade de nós Code no workflow')
+    parser.add_argument('--repeat', type=int, default=50, help='Repetições por medição')
+    args = parser.parse_args()
+
+    workflow = build_workflow(args.nodes)
+    pretty = json.dumps(workflow, indent=2, ensure_ascii=False).encode('utf-8')
+
+    # As saídas precisam ser idênticas byte a byte
+    assert json_codec.dumps_pretty(workflow) == pretty
+    assert json_codec.dumps_canonical(workflow) == \
+        json.dumps(workflow, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    assert json_codec.loads(pretty) == workflow
+
+    print(f"Workflow: {args.nodes} nós, {len(pretty) / 1024:.0f}KB | backend: {json_codec.BACKEND}\n")
+
+    cases = [
+        ('load', lambda: json.loads(pretty), lambda: json_codec.loads(pretty)),
+        ('save (indent=2)',
+         lambda: json.dumps(workflow, indent=2, ensure_ascii=False).encode('utf-8'),
+         lambda: json_codec.dumps_pretty(workflow)),
+        ('hash',
+         lambda: hashlib.sha256(json.dumps(workflow, sort_keys=True, separators=(',', ':')).encode()).hexdigest(),
+         lambda: hashlib.sha256(json_codec.dumps_canonical(workflow)).hexdigest()),
+    ]
+
+    print(f"{'operação':<18} {'json':>10} {'codec':>10} {'ganho':>8}")
+    for label, stdlib_func, codec_func in cases:
+        stdlib_time = timed(stdlib_func, args.repeat)
+        codec_time = timed(codec_func, args.repeat)
+        print(f"{label:<18} {stdlib_time * 1000:8.2f}ms {codec_time * 1000:8.2f}ms {stdlib_time / codec_time:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
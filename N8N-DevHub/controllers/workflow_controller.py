@@ -5,8 +5,21 @@ Controla operações e lógica de negócios para workflows
 
 import os
 import re
-from typing import List, Optional, Dict, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Iterator, List, Optional, Dict, Tuple
 from models.workflow_model import WorkflowModel, WorkflowInfo
+from utils.workflow_cache import RemoteWorkflowCache
+from utils.workflow_graph import build_dependency_graph, remap_subworkflow_ids, run_in_dependency_order
+from utils.workflow_hash import calculate_workflow_fingerprint, calculate_workflow_hash
+from utils.workflow_diff import diff_workflows
+from utils.http_client import RequestCounter
+from utils.local_index import LocalWorkflow
+from utils.name_index import WorkflowNameIndex
+
+
+# Campos que uma resposta de create/update precisa ter para virar o arquivo local
+REQUIRED_WORKFLOW_FIELDS = ('id', 'name', 'nodes', 'connections', 'updatedAt')
 
 
 class WorkflowController:
@@ -14,43 +27,77 @@ class WorkflowController:
     
     def __init__(self, model: WorkflowModel = None):
         self.model = model or WorkflowModel()
+        
+        # Requisições HTTP feitas pelo último upload (upload_workflow/upload_all_workflows)
+        self.last_request_count = 0
+        
+        # Cache da listagem remota (compartilhado por buscas por nome/ID)
+        self.remote_cache = RemoteWorkflowCache()
+        
+        # Índice de nomes, atualizado a partir da listagem em cache
+        self.name_index = WorkflowNameIndex()
     
-    def list_remote_workflows(self, active_only: bool = False, inactive_only: bool = False) -> List[WorkflowInfo]:
-        """Lista workflows remotos com filtros"""
+    def iter_remote_workflows(self, active_only: bool = False, inactive_only: bool = False,
+                              refresh: bool = False) -> Iterator[WorkflowInfo]:
+        """Itera sobre workflows remotos com filtros, página a página"""
         try:
-            workflows = self.model.get_all_workflows()
-            if workflows is None:
-                return []
-            
-            if active_only:
-                workflows = [wf for wf in workflows if wf.active]
-            elif inactive_only:
-                workflows = [wf for wf in workflows if not wf.active]
-            
-            return workflows
+            cached = None if refresh else self.remote_cache.get()
+            source = cached if cached is not None else self._iter_and_cache_remote()
+            
+            for wf in source:
+                if active_only and not wf.active:
+                    continue
+                if inactive_only and wf.active:
+                    continue
+                yield wf
         except Exception as e:
             raise Exception(f"Erro ao listar workflows remotos: {e}")
     
-    def list_local_workflows(self) -> List[Dict]:
-        """Lista workflows locais"""
+    def _iter_and_cache_remote(self) -> Iterator[WorkflowInfo]:
+        """Itera sobre a listagem da API e armazena no cache ao final"""
+        version = self.remote_cache.version
+        workflows = []
+        for wf in self.model.iter_workflows():
+            workflows.append(wf)
+            yield wf
+        
+        self.remote_cache.store(workflows, since=version)
+    
+    def list_remote_workflows(self, active_only: bool = False, inactive_only: bool = False,
+                              refresh: bool = False) -> List[WorkflowInfo]:
+        """Lista workflows remotos com filtros"""
+        return list(self.iter_remote_workflows(active_only, inactive_only, refresh))
+    
+    def list_local_workflows(self) -> List[LocalWorkflow]:
+        """Lista workflows locais (conteúdo carregado sob demanda)"""
         return self.model.get_local_workflows()
     
-    def find_workflow_by_name(self, name: str, fuzzy: bool = True) -> List[WorkflowInfo]:
-        """Encontra workflows por nome (exato ou aproximado)"""
+    def _current_name_index(self) -> WorkflowNameIndex:
+        """Índice de nomes em dia com a listagem (refaz a listagem se o cache expirou)"""
+        version = self.remote_cache.fresh_version()
+        if version is None or version != self.name_index.version:
+            workflows = self.list_remote_workflows()
+            self.name_index.refresh(workflows, self.remote_cache.version)
+        return self.name_index
+    
+    def find_workflow_by_name(self, name: str, fuzzy: bool = True, limit: Optional[int] = None,
+                              tolerate_typos: bool = False) -> List[WorkflowInfo]:
+        """
+        Encontra workflows por nome (exato ou aproximado)
+        Aproximado: nomes que contêm o texto (sem diferenciar maiúsculas), do mais ao
+        menos relevante; com tolerate_typos, se nada contiver o texto, retorna os nomes
+        mais parecidos
+        """
         try:
-            all_workflows = self.model.get_all_workflows()
-            if not all_workflows:
-                return []
-            
-            if fuzzy:
-                # Busca aproximada (case-insensitive, partial match)
-                name_lower = name.lower()
-                matches = [wf for wf in all_workflows 
-                          if name_lower in wf.name.lower()]
-            else:
+            index = self._current_name_index()
+            
+            if not fuzzy:
                 # Busca exata
-                matches = [wf for wf in all_workflows 
-                          if wf.name == name]
+                return index.find_exact(name)
+            
+            matches = index.search(name, limit)
+            if not matches and tolerate_typos:
+                matches = index.search_similar(name, limit or 10)
             
             return matches
         except Exception as e:
@@ -59,11 +106,11 @@ class WorkflowController:
     def find_workflow_by_id(self, workflow_id: str) -> Optional[WorkflowInfo]:
         """Encontra workflow por ID"""
         try:
-            all_workflows = self.model.get_all_workflows()
-            if not all_workflows:
-                return None
+            cached = self.remote_cache.get_by_id(workflow_id)
+            if cached:
+                return cached
             
-            for wf in all_workflows:
+            for wf in self.list_remote_workflows():
                 if wf.id == workflow_id:
                     return wf
             
@@ -110,43 +157,122 @@ class WorkflowController:
             filepath = self.model.save_workflow_to_file(workflow_data)
             filename = os.path.basename(filepath)
             
+            self.model.remote_fingerprints.record(workflow_data)
+            self.model.save_state()
+            
             return True, f"Workflow '{workflow_info.name}' baixado como {filename}", filepath
             
         except Exception as e:
             return False, f"Erro ao baixar workflow: {e}", None
     
-    def download_all_workflows(self, active_only: bool = False, inactive_only: bool = False) -> Tuple[int, int, List[str]]:
+    def download_all_workflows(self, active_only: bool = False, inactive_only: bool = False,
+                               jobs: int = 1, progress_callback: Callable = None) -> Tuple[int, int, List[str]]:
         """
         Baixa todos os workflows
+        jobs > 1 busca detalhes em paralelo enquanto os arquivos são gravados
+        progress_callback(done, total, name, success) é chamado a cada workflow
         Returns: (success_count, total_count, error_messages)
         """
         try:
             workflows = self.list_remote_workflows(active_only, inactive_only)
+            
+            if jobs > 1:
+                success_count, error_messages = self._download_parallel(workflows, jobs, progress_callback)
+                self.model.save_state()
+                return success_count, len(workflows), error_messages
+            
             success_count = 0
             error_messages = []
             
-            for workflow_info in workflows:
+            for done, workflow_info in enumerate(workflows, 1):
+                ok = False
                 try:
                     workflow_data = self.model.get_workflow_by_id(workflow_info.id)
                     if workflow_data:
                         self.model.save_workflow_to_file(workflow_data)
+                        self.model.remote_fingerprints.record(workflow_data)
                         success_count += 1
+                        ok = True
                     else:
                         error_messages.append(f"Erro ao baixar detalhes de '{workflow_info.name}'")
                         
                 except Exception as e:
                     error_messages.append(f"Erro ao baixar '{workflow_info.name}': {e}")
+                
+                if progress_callback:
+                    progress_callback(done, len(workflows), workflow_info.name, ok)
             
+            self.model.save_state()
             return success_count, len(workflows), error_messages
             
         except Exception as e:
             return 0, 0, [f"Erro ao listar workflows: {e}"]
     
-    def upload_workflow(self, identifier: str, by_filename: bool = True) -> Tuple[bool, str]:
+    def _download_parallel(self, workflows: List[WorkflowInfo], jobs: int,
+                           progress_callback: Callable = None) -> Tuple[int, List[str]]:
+        """
+        Busca detalhes em um pool de threads e grava os arquivos na thread atual,
+        sobrepondo rede e disco (no máximo 2*jobs downloads pendentes em memória)
+        Returns: (success_count, error_messages)
+        """
+        self.model.http.resize_pool(jobs)
+        
+        success_count = 0
+        error_messages = []
+        done = 0
+        pending = {}
+        queued = iter(workflows)
+        
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix='devhub-download') as executor:
+            while True:
+                # Manter o pool abastecido
+                for workflow_info in queued:
+                    future = executor.submit(self.model.get_workflow_by_id, workflow_info.id)
+                    pending[future] = workflow_info
+                    if len(pending) >= jobs * 2:
+                        break
+                
+                if not pending:
+                    break
+                
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                
+                for future in finished:
+                    workflow_info = pending.pop(future)
+                    done += 1
+                    ok = False
+                    
+                    try:
+                        workflow_data = future.result()
+                        if workflow_data:
+                            self.model.save_workflow_to_file(workflow_data)
+                            self.model.remote_fingerprints.record(workflow_data)
+                            success_count += 1
+                            ok = True
+                        else:
+                            error_messages.append(f"Erro ao baixar detalhes de '{workflow_info.name}'")
+                    except Exception as e:
+                        error_messages.append(f"Erro ao baixar '{workflow_info.name}': {e}")
+                    
+                    if progress_callback:
+                        progress_callback(done, len(workflows), workflow_info.name, ok)
+        
+        return success_count, error_messages
+    
+    def upload_workflow(self, identifier: str, by_filename: bool = True, force: bool = False) -> Tuple[bool, str]:
         """
         Envia um workflow específico
+        Workflows idênticos à última versão remota conhecida são ignorados (exceto com force)
         Returns: (success, message)
         """
+        with self.model.http.track_requests() as counter:
+            try:
+                return self._upload_workflow(identifier, by_filename, force)
+            finally:
+                self.last_request_count = counter.count
+    
+    def _upload_workflow(self, identifier: str, by_filename: bool, force: bool) -> Tuple[bool, str]:
+        """Implementação de upload_workflow"""
         try:
             workflow_data = None
             
@@ -159,12 +285,10 @@ class WorkflowController:
                 if not workflow_data:
                     return False, f"Arquivo '{identifier}' não encontrado"
             else:
-                # Buscar por ID extraído do arquivo
-                local_workflows = self.model.get_local_workflows()
-                for wf in local_workflows:
-                    if wf.get('id') == identifier:
-                        workflow_data = wf['data']
-                        break
+                # Buscar pelo índice ID -> arquivo (lê apenas o arquivo correspondente)
+                local_workflow = self.model.find_local_workflow_by_id(identifier)
+                if local_workflow:
+                    workflow_data = local_workflow.data
                 
                 if not workflow_data:
                     return False, f"Workflow com ID '{identifier}' não encontrado localmente"
@@ -173,30 +297,28 @@ class WorkflowController:
             workflow_id = workflow_data.get('id')
             workflow_name = workflow_data.get('name', 'Unknown')
             
-            existing = None
+            # Existência decidida pela listagem em cache; sem cache, uma consulta pelo ID
+            # (listar todos os workflows custaria uma requisição por página)
+            existing = False
             if workflow_id:
-                existing = self.model.get_workflow_by_id(workflow_id)
-            
-            if existing:
-                # Atualizar workflow existente
-                result = self.model.update_workflow(workflow_id, workflow_data)
-                if result:
-                    # Após sucesso: substituir arquivo local pela versão padrão DevHub
-                    if by_filename:
-                        self._refresh_local_workflow_after_upload(result, identifier)
-                    return True, f"Workflow '{workflow_name}' atualizado com sucesso"
-                else:
-                    return False, f"Erro ao atualizar workflow '{workflow_name}'"
-            else:
-                # Criar novo workflow
-                result = self.model.create_workflow(workflow_data)
-                if result:
-                    # Após sucesso: substituir arquivo local pela versão padrão DevHub
-                    if by_filename:
-                        self._refresh_local_workflow_after_upload(result, identifier)
-                    return True, f"Workflow '{workflow_name}' criado com sucesso"
-                else:
-                    return False, f"Erro ao criar workflow '{workflow_name}'"
+                existing = self.remote_cache.has_workflow(workflow_id)
+                if existing is None:
+                    existing = self.model.get_workflow_by_id(workflow_id) is not None
+            
+            if existing and not force and self._is_unchanged(workflow_data):
+                return True, f"Workflow '{workflow_name}' inalterado, envio ignorado"
+            
+            result, action = self._push_workflow(workflow_data, existing)
+            if not result:
+                operation = "atualizar" if existing else "criar"
+                return False, f"Erro ao {operation} workflow '{workflow_name}'"
+            
+            # Após sucesso: substituir arquivo local pela versão padrão DevHub
+            if by_filename:
+                self._refresh_local_workflow_after_upload(result, identifier)
+            self.model.save_state()
+            
+            return True, f"Workflow '{workflow_name}' {action} com sucesso"
                     
         except Exception as e:
             return False, f"Erro ao enviar workflow: {e}"
@@ -215,10 +337,12 @@ class WorkflowController:
             if not workflow_id:
                 return
             
-            # Baixar versão atualizada do servidor
-            fresh_workflow = self.model.get_workflow_by_id(workflow_id)
-            if not fresh_workflow:
-                return
+            # Usar a resposta do create/update; buscar no servidor apenas se incompleta
+            fresh_workflow = uploaded_workflow
+            if any(field not in uploaded_workflow for field in REQUIRED_WORKFLOW_FIELDS):
+                fresh_workflow = self.model.get_workflow_by_id(workflow_id)
+                if not fresh_workflow:
+                    return
             
             # Gerar nome do arquivo no padrão DevHub
             safe_name = re.sub(r'[^\w\s-]', '', workflow_name).strip()
@@ -232,12 +356,14 @@ class WorkflowController:
             
             # Salvar no padrão DevHub
             filepath = self.model.save_workflow_to_file(fresh_workflow, devhub_filename)
+            self.model.remote_fingerprints.record(fresh_workflow)
             
             if filepath:
                 # Se o arquivo original for diferente do padrão DevHub, removê-lo
                 if original_path != devhub_path and os.path.exists(original_path):
                     try:
                         os.remove(original_path)
+                        self.model.local_index.remove(original_path)
                     except OSError:
                         pass  # Ignorar erro de remoção
                         
@@ -245,52 +371,119 @@ class WorkflowController:
             # Ignorar erros no refresh - o upload já foi bem-sucedido
             pass
     
-    def upload_all_workflows(self) -> Tuple[int, int, List[str]]:
+    def upload_all_workflows(self, jobs: int = 1, progress_callback: Callable = None,
+                             force: bool = False) -> Tuple[int, int, List[str]]:
         """
         Envia todos os workflows locais
+        Sub-workflows (nós Execute Workflow) são enviados antes de quem os chama;
+        workflows independentes são enviados em paralelo quando jobs > 1
+        Workflows inalterados desde o último download/upload são ignorados (exceto com force)
+        progress_callback(done, total, name, success) é chamado a cada workflow
         Returns: (success_count, total_count, error_messages)
         """
+        with self.model.http.track_requests() as counter:
+            try:
+                return self._upload_all_workflows(jobs, progress_callback, force, counter)
+            finally:
+                self.last_request_count = counter.count
+    
+    def _upload_all_workflows(self, jobs: int, progress_callback: Optional[Callable], force: bool,
+                              counter: RequestCounter) -> Tuple[int, int, List[str]]:
+        """Implementação de upload_all_workflows (counter soma as requisições das threads)"""
         try:
             local_workflows = self.model.get_local_workflows()
-            success_count = 0
-            error_messages = []
+            entries = {wf.filename: wf for wf in local_workflows}
             
-            for wf in local_workflows:
-                try:
-                    workflow_data = wf['data']
-                    workflow_id = workflow_data.get('id')
-                    workflow_name = workflow_data.get('name', 'Unknown')
-                    original_filename = wf.get('filename', '')
-                    
-                    # Verificar se existe remotamente
-                    existing = None
-                    if workflow_id:
-                        existing = self.model.get_workflow_by_id(workflow_id)
-                    
-                    if existing:
-                        # Atualizar
-                        result = self.model.update_workflow(workflow_id, workflow_data)
-                        action = "atualizado"
-                    else:
-                        # Criar
-                        result = self.model.create_workflow(workflow_data)
-                        action = "criado"
+            # Uma única listagem decide entre criar e atualizar
+            remote_ids = {wf.id for wf in self.list_remote_workflows()}
+            graph = build_dependency_graph({filename: wf.data for filename, wf in entries.items()})
+            
+            # IDs de sub-workflows recriados com outro ID (antigo -> novo)
+            id_map = {}
+            id_map_lock = threading.Lock()
+            
+            def upload(filename: str) -> Optional[Dict]:
+                workflow_data = entries[filename].data
+                workflow_id = workflow_data.get('id')
+                
+                with id_map_lock:
+                    workflow_data = remap_subworkflow_ids(workflow_data, dict(id_map))
+                
+                exists = bool(workflow_id) and workflow_id in remote_ids
+                if exists and not force and self._is_unchanged(workflow_data):
+                    return workflow_data
+                
+                # Requisições das threads de trabalho entram no contador da operação
+                with self.model.http.track_requests(counter):
+                    result, _ = self._push_workflow(workflow_data, exists)
                     
                     if result:
-                        success_count += 1
+                        new_id = result.get('id')
+                        if workflow_id and new_id and new_id != workflow_id:
+                            with id_map_lock:
+                                id_map[workflow_id] = new_id
                         # Após sucesso: substituir arquivo local pela versão padrão DevHub
-                        self._refresh_local_workflow_after_upload(result, original_filename)
-                    else:
-                        error_messages.append(f"Erro ao processar '{workflow_name}'")
-                        
-                except Exception as e:
-                    error_messages.append(f"Erro ao processar '{wf.get('filename', 'unknown')}': {e}")
+                        self._refresh_local_workflow_after_upload(result, filename)
+                
+                return result
+            
+            if jobs > 1:
+                self.model.http.resize_pool(jobs)
+            
+            success_count = 0
+            error_messages = []
+            
+            for done, (filename, result, error) in enumerate(run_in_dependency_order(graph, upload, jobs), 1):
+                workflow_name = entries[filename].name
+                
+                if error:
+                    error_messages.append(f"Erro ao processar '{filename}': {error}")
+                elif result:
+                    success_count += 1
+                else:
+                    error_messages.append(f"Erro ao processar '{workflow_name}'")
+                
+                if progress_callback:
+                    progress_callback(done, len(entries), workflow_name, bool(result) and not error)
             
+            self.model.save_state()
             return success_count, len(local_workflows), error_messages
             
         except Exception as e:
             return 0, 0, [f"Erro ao processar workflows locais: {e}"]
     
+    def _push_workflow(self, workflow_data: Dict, exists: bool) -> Tuple[Optional[Dict], str]:
+        """
+        Cria ou atualiza um workflow no n8n
+        Returns: (resultado da API, ação executada)
+        """
+        if exists:
+            result = self.model.update_workflow(workflow_data.get('id'), workflow_data)
+            action = "atualizado"
+        else:
+            result = self.model.create_workflow(workflow_data)
+            action = "criado"
+        
+        if result and all(field in result for field in REQUIRED_WORKFLOW_FIELDS):
+            # Resposta completa: estado remoto conhecido sem refazer a listagem
+            self.model.remote_fingerprints.record(result)
+            self.remote_cache.upsert(self.model._to_workflow_info(result))
+        else:
+            # Estado remoto desconhecido: o próximo upload não pode ser ignorado
+            for workflow_id in {workflow_data.get('id'), (result or {}).get('id')} - {None}:
+                self.model.remote_fingerprints.forget(workflow_id)
+            self.remote_cache.invalidate()
+        return result, action
+    
+    def _is_unchanged(self, workflow_data: Dict) -> bool:
+        """Verifica se o workflow local é idêntico à última versão remota conhecida"""
+        workflow_id = workflow_data.get('id')
+        if not workflow_id:
+            return False
+        
+        remote_hash = self.model.remote_fingerprints.get(workflow_id)
+        return remote_hash is not None and remote_hash == calculate_workflow_hash(workflow_data)
+    
     def activate_workflow(self, identifier: str, by_id: bool = False) -> Tuple[bool, str]:
         """Ativa um workflow"""
         try:
@@ -308,6 +501,7 @@ class WorkflowController:
                 workflow_id = matches[0].id
             
             success = self.model.activate_workflow(workflow_id)
+            self.remote_cache.invalidate()
             if success:
                 return True, f"Workflow ativado com sucesso"
             else:
@@ -333,6 +527,7 @@ class WorkflowController:
                 workflow_id = matches[0].id
             
             success = self.model.deactivate_workflow(workflow_id)
+            self.remote_cache.invalidate()
             if success:
                 return True, f"Workflow desativado com sucesso"
             else:
@@ -370,6 +565,7 @@ class WorkflowController:
                     workflow_name = identifier  # Fallback para o ID
             
             success = self.model.delete_workflow(workflow_id)
+            self.remote_cache.invalidate()
             if success:
                 return True, f"Workflow '{workflow_name}' removido com sucesso"
             else:
@@ -382,10 +578,10 @@ class WorkflowController:
         """Compara workflows locais e remotos"""
         try:
             local_workflows = self.model.get_local_workflows()
-            remote_workflows = self.model.get_all_workflows() or []
+            remote_workflows = self.list_remote_workflows()
             
             # Criar dicionários para comparação
-            local_by_id = {wf.get('id'): wf for wf in local_workflows if wf.get('id')}
+            local_by_id = {wf.id: wf for wf in local_workflows if wf.id}
             remote_by_id = {wf.id: wf for wf in remote_workflows}
             
             # Análise
@@ -414,4 +610,94 @@ class WorkflowController:
             }
             
         except Exception as e:
-            raise Exception(f"Erro ao comparar workflows: {e}")
\ No newline at end of file
+            raise Exception(f"Erro ao comparar workflows: {e}")
+    
+    def diff_local_remote(self, identifier: str = None, by_id: bool = False, jobs: int = 1) -> List[Dict]:
+        """
+        Diferença estrutural (nós, parâmetros e conexões) entre workflows locais e remotos
+        identifier limita a um workflow (nome ou ID); sem ele, compara todos.
+        Workflows cujo hash local e updatedAt remoto batem com o último estado
+        conhecido são considerados iguais sem baixar o conteúdo.
+        Returns: [{'id', 'name', 'status': equal|modified|only_local|only_remote, 'diff'}]
+        """
+        try:
+            workflow_id = None
+            if identifier:
+                workflow_id = identifier if by_id else self._resolve_workflow_id(identifier)
+            
+            local_by_id = {}
+            only_local = []
+            for wf in self.model.get_local_workflows():
+                if wf.id and wf.id not in local_by_id:
+                    local_by_id[wf.id] = wf
+                elif not wf.id and not workflow_id:
+                    only_local.append(wf)
+            # Listagem atual (o updatedAt decide quais workflows precisam ser baixados)
+            remote_by_id = {wf.id: wf for wf in self.list_remote_workflows(refresh=True)}
+            
+            if workflow_id:
+                if workflow_id not in local_by_id and workflow_id not in remote_by_id:
+                    raise Exception(f"Workflow '{identifier}' não encontrado")
+                local_by_id = {k: v for k, v in local_by_id.items() if k == workflow_id}
+                remote_by_id = {k: v for k, v in remote_by_id.items() if k == workflow_id}
+            
+            results = [
+                {'id': wf.id, 'name': wf.name, 'status': 'only_local', 'diff': None}
+                for wf in only_local + [wf for wid, wf in local_by_id.items() if wid not in remote_by_id]
+            ]
+            results.extend(
+                {'id': wid, 'name': wf.name, 'status': 'only_remote', 'diff': None}
+                for wid, wf in remote_by_id.items() if wid not in local_by_id
+            )
+            
+            # Iguais ao último estado conhecido dispensam o download
+            to_fetch = []
+            for wid, local_wf in local_by_id.items():
+                if wid not in remote_by_id:
+                    continue
+                entry = self.model.remote_fingerprints.get_entry(wid)
+                if (entry and entry.get('hash') == local_wf.hash
+                        and entry.get('updated_at') == remote_by_id[wid].updated_at):
+                    results.append({'id': wid, 'name': local_wf.name, 'status': 'equal', 'diff': None})
+                else:
+                    to_fetch.append(local_wf)
+            
+            def compare(local_wf: LocalWorkflow) -> Dict:
+                remote_data = self.model.get_workflow_by_id(local_wf.id)
+                if not remote_data:
+                    return {'id': local_wf.id, 'name': local_wf.name, 'status': 'only_local', 'diff': None}
+                
+                remote_fingerprint = calculate_workflow_fingerprint(remote_data)
+                self.model.remote_fingerprints.record(remote_data, remote_fingerprint.root)
+                diff = diff_workflows(remote_data, local_wf.data, old_fingerprint=remote_fingerprint)
+                local_wf.release()
+                return {
+                    'id': local_wf.id,
+                    'name': local_wf.name,
+                    'status': 'equal' if diff['equal'] else 'modified',
+                    'diff': None if diff['equal'] else diff
+                }
+            
+            if jobs > 1 and len(to_fetch) > 1:
+                self.model.http.resize_pool(jobs)
+                with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix='devhub-diff') as executor:
+                    results.extend(executor.map(compare, to_fetch))
+            else:
+                results.extend(compare(wf) for wf in to_fetch)
+            
+            self.model.save_state()
+            results.sort(key=lambda r: ((r['name'] or '').lower(), r['id'] or ''))
+            return results
+            
+        except Exception as e:
+            raise Exception(f"Erro ao comparar workflows: {e}")
+    
+    def _resolve_workflow_id(self, name: str) -> str:
+        """ID do único workflow remoto com o nome (exato, senão aproximado)"""
+        matches = self.find_workflow_by_name(name, fuzzy=False) or self.find_workflow_by_name(name)
+        if len(matches) == 0:
+            raise Exception(f"Workflow '{name}' não encontrado")
+        elif len(matches) > 1:
+            names = [f"'{wf.name}' ({wf.id})" for wf in matches]
+            raise Exception(f"Múltiplos workflows encontrados: {', '.join(names)}")
+        return matches[0].id
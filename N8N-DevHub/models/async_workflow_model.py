@@ -0,0 +1,237 @@
+"""
+N8N-DevHub - Async Workflow Model
+Versão asyncio do WorkflowModel com concorrência limitada
+"""
+
+import asyncio
+import os
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+import aiohttp
+
+from models.workflow_model import WorkflowModel, WorkflowInfo
+from utils import json_codec
+from utils.http_client import IDEMPOTENT_METHODS, RETRY_STATUS_CODES, is_throttle_retryable
+from utils.rate_limiter import parse_retry_after
+
+
+class AsyncWorkflowModel:
+    """Model assíncrono para workflows do n8n (mesma interface do WorkflowModel)"""
+
+    def __init__(self, model: WorkflowModel = None, concurrency: int = None):
+        # Reaproveita configuração (URL, autenticação, timeouts) do model síncrono
+        self.model = model or WorkflowModel()
+        self.base_url = self.model.base_url
+        self.headers = dict(self.model.headers)
+
+        # Máximo de requisições simultâneas em voo
+        if concurrency is None:
+            try:
+                concurrency = int(os.getenv('N8N_ASYNC_CONCURRENCY', 20))
+            except ValueError:
+                concurrency = 20
+        self.concurrency = max(1, concurrency)
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def open(self):
+        """Abre sessão HTTP (deve ser chamada dentro do event loop)"""
+        if self._session is not None:
+            return
+
+        http = self.model.http
+        timeout = aiohttp.ClientTimeout(
+            sock_connect=http.connect_timeout,
+            sock_read=http.read_timeout
+        )
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.concurrency)
+        self._session = aiohttp.ClientSession(headers=self.headers, timeout=timeout, connector=connector)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+    async def close(self):
+        """Fecha sessão HTTP"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> Tuple[int, Any, str]:
+        """
+        Faz requisição HTTP para a API do n8n
+        Returns: (status, json, text)
+        """
+        if self._session is None:
+            await self.open()
+
+        url = f"{self.base_url}/api/v1/{endpoint.lstrip('/')}"
+        http = self.model.http
+        limiter = http.rate_limiter
+        retries = http.max_retries if method in IDEMPOTENT_METHODS else 0
+        attempt = 0
+        throttle_attempts = 0
+
+        while True:
+            # Limitador compartilhado com o model síncrono
+            await limiter.acquire_async()
+            status, retry_after, text = None, None, ''
+
+            try:
+                async with self._semaphore:
+                    async with self._session.request(method, url, **kwargs) as response:
+                        status = response.status
+                        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                        text = await response.text()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= retries:
+                    raise
+            finally:
+                limiter.release(status, retry_after)
+
+            if (is_throttle_retryable(method, status, retry_after)
+                    and throttle_attempts < http.max_throttle_retries):
+                # Espera (Retry-After/backoff) aplicada pelo limiter
+                throttle_attempts += 1
+                continue
+
+            if status is not None and (status not in RETRY_STATUS_CODES or attempt >= retries):
+                break
+
+            # Backoff exponencial
+            await asyncio.sleep(http.backoff_factor * (2 ** attempt))
+            attempt += 1
+
+        try:
+            data = json_codec.loads(text) if text else None
+        except ValueError:
+            data = None
+
+        return status, data, text
+
+    @staticmethod
+    def _unwrap(data: Any) -> Any:
+        """Remove envelope 'data' da resposta, se houver"""
+        return data.get('data', data) if isinstance(data, dict) and 'data' in data else data
+
+    async def iter_workflows(self, limit: int = 100) -> AsyncIterator[WorkflowInfo]:
+        """Itera sobre todos os workflows do n8n seguindo a paginação por cursor"""
+        cursor = None
+
+        try:
+            while True:
+                params = {'limit': limit}
+                if cursor:
+                    params['cursor'] = cursor
+
+                status, data, text = await self._make_request('GET', 'workflows', params=params)
+
+                if status != 200:
+                    raise Exception(f"API Error: {status} - {text}")
+
+                workflows_data = data.get('data', []) if isinstance(data, dict) else (data or [])
+
+                for wf in workflows_data:
+                    yield self.model._to_workflow_info(wf)
+
+                cursor = data.get('nextCursor') if isinstance(data, dict) else None
+                if not cursor:
+                    break
+
+        except aiohttp.ClientConnectionError:
+            raise Exception(f"Não foi possível conectar ao n8n em {self.base_url}")
+        except asyncio.TimeoutError:
+            raise Exception(f"Timeout: n8n não respondeu em {self.model.http.read_timeout:g} segundos")
+
+    async def get_all_workflows(self) -> Optional[List[WorkflowInfo]]:
+        """Busca todos os workflows do n8n"""
+        return [wf async for wf in self.iter_workflows()]
+
+    async def get_workflow_by_id(self, workflow_id: str) -> Optional[Dict]:
+        """Busca um workflow específico por ID"""
+        try:
+            status, data, text = await self._make_request('GET', f'workflows/{workflow_id}')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise Exception(f"Erro de conexão ao buscar workflow {workflow_id}: {e}")
+
+        if status == 200:
+            return self._unwrap(data)
+        elif status == 404:
+            return None
+        else:
+            raise Exception(f"Erro ao buscar workflow {workflow_id}: {status} - {text}")
+
+    async def get_workflows_by_ids(self, workflow_ids: Iterable[str]) -> Dict[str, Any]:
+        """
+        Busca vários workflows em paralelo (limitado pela concorrência)
+        Returns: {id: workflow | None | Exception}
+        """
+        workflow_ids = list(workflow_ids)
+        results = await asyncio.gather(
+            *(self.get_workflow_by_id(wf_id) for wf_id in workflow_ids),
+            return_exceptions=True
+        )
+        return dict(zip(workflow_ids, results))
+
+    async def create_workflow(self, workflow_data: Dict) -> Optional[Dict]:
+        """Cria um novo workflow"""
+        clean_data = self.model._clean_workflow_data(workflow_data)
+
+        try:
+            status, data, text = await self._make_request('POST', 'workflows', json=clean_data)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise Exception(f"Erro de conexão ao criar workflow: {e}")
+
+        if status in [200, 201]:
+            return self._unwrap(data)
+        else:
+            raise Exception(f"Erro ao criar workflow: {status} - {text}")
+
+    async def update_workflow(self, workflow_id: str, workflow_data: Dict) -> Optional[Dict]:
+        """Atualiza um workflow existente"""
+        clean_data = self.model._clean_workflow_data(workflow_data)
+
+        try:
+            status, data, text = await self._make_request('PUT', f'workflows/{workflow_id}', json=clean_data)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise Exception(f"Erro de conexão ao atualizar workflow: {e}")
+
+        if status == 200:
+            return self._unwrap(data)
+        else:
+            raise Exception(f"Erro ao atualizar workflow {workflow_id}: {status} - {text}")
+
+    async def delete_workflow(self, workflow_id: str) -> bool:
+        """Remove um workflow"""
+        try:
+            status, data, text = await self._make_request('DELETE', f'workflows/{workflow_id}')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise Exception(f"Erro de conexão ao deletar workflow: {e}")
+
+        if status in [200, 204]:
+            return True
+        elif status == 404:
+            return False
+        else:
+            raise Exception(f"Erro ao deletar workflow {workflow_id}: {status} - {text}")
+
+    async def activate_workflow(self, workflow_id: str) -> bool:
+        """Ativa um workflow"""
+        try:
+            status, _, _ = await self._make_request('POST', f'workflows/{workflow_id}/activate')
+            return status == 200
+        except Exception:
+            return False
+
+    async def deactivate_workflow(self, workflow_id: str) -> bool:
+        """Desativa um workflow"""
+        try:
+            status, _, _ = await self._make_request('POST', f'workflows/{workflow_id}/deactivate')
+            return status == 200
+        except Exception:
+            return False
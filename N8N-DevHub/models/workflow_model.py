@@ -4,13 +4,28 @@ Gerencia dados e operações relacionadas a workflows do n8n
 """
 
 import requests
-import json
 import os
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 
+from utils.http_client import HTTPClient
+from utils import json_codec
+from utils.file_utils import extract_workflow_id, write_file_atomic
+from utils.fingerprint_store import RemoteFingerprintStore
+from utils.local_index import LocalWorkflow, LocalWorkflowIndex
+from utils.sync_state_store import SyncStateStore
+from utils.write_intents import WriteIntentRegistry
+
+
+# Campos read-only ou gerados pelo n8n, removidos antes do upload
+UPLOAD_EXCLUDED_FIELDS = frozenset([
+    'id', 'createdAt', 'updatedAt', 'shared', 'versionId', 'meta',
+    'active', 'tags', 'pinData', 'triggerCount', 'isArchived'
+])
+NODE_EXCLUDED_FIELDS = frozenset(['id', 'webhookId'])
+
 
 @dataclass
 class WorkflowInfo:
@@ -65,45 +80,113 @@ class WorkflowModel:
             credentials = base64.b64encode(f"{user}:{password}".encode()).decode()
             self.headers['Authorization'] = f'Basic {credentials}'
         
+        # Sessão HTTP persistente (pool de conexões, retries e timeouts)
+        self.http = HTTPClient(headers=self.headers)
+        
+        # Estado local do DevHub (criado sob demanda em workflows/.devhub)
+        self._remote_fingerprints = None
+        self._local_index = None
+        self._sync_state_store = None
+        
+        # Arquivos gravados durante o sync (definido pelo AsyncSyncManager)
+        self.write_intents: Optional[WriteIntentRegistry] = None
+        
         # Garantir que diretório existe
         os.makedirs(self.workflows_dir, exist_ok=True)
     
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Faz requisição HTTP para a API do n8n"""
         url = f"{self.base_url}/api/v1/{endpoint.lstrip('/')}"
-        kwargs.setdefault('headers', self.headers)
-        kwargs.setdefault('timeout', 10)
         
-        return requests.request(method, url, **kwargs)
+        return self.http.request(method, url, **kwargs)
     
-    def get_all_workflows(self) -> Optional[List[WorkflowInfo]]:
-        """Busca todos os workflows do n8n"""
+    def get_http_stats(self) -> Dict:
+        """Retorna estatísticas do pool de conexões HTTP"""
+        return self.http.get_pool_stats()
+    
+    @property
+    def state_dir(self) -> str:
+        """Diretório de estado interno do DevHub (fora do glob *.json)"""
+        return os.path.join(self.workflows_dir, '.devhub')
+    
+    def ensure_state_dir(self) -> str:
+        """Cria diretório de estado (ignorado pelo git do usuário)"""
+        os.makedirs(self.state_dir, exist_ok=True)
+        gitignore = os.path.join(self.state_dir, '.gitignore')
+        if not os.path.exists(gitignore):
+            with open(gitignore, 'w', encoding='utf-8') as f:
+                f.write('*\n')
+        return self.state_dir
+    
+    @property
+    def remote_fingerprints(self) -> RemoteFingerprintStore:
+        """Último fingerprint remoto conhecido por workflow"""
+        if self._remote_fingerprints is None:
+            path = os.path.join(self.ensure_state_dir(), 'remote_fingerprints.json')
+            self._remote_fingerprints = RemoteFingerprintStore(path)
+        return self._remote_fingerprints
+    
+    @property
+    def local_index(self) -> LocalWorkflowIndex:
+        """Manifesto persistente da pasta de workflows"""
+        if self._local_index is None:
+            path = os.path.join(self.ensure_state_dir(), 'manifest.json')
+            self._local_index = LocalWorkflowIndex(self.workflows_dir, path)
+        return self._local_index
+    
+    @property
+    def sync_state_store(self) -> SyncStateStore:
+        """Estado persistente da sincronização em tempo real"""
+        if self._sync_state_store is None:
+            path = os.path.join(self.ensure_state_dir(), 'sync_state.db')
+            self._sync_state_store = SyncStateStore(path)
+        return self._sync_state_store
+    
+    def iter_workflows(self, limit: int = 100) -> Iterator[WorkflowInfo]:
+        """Itera sobre todos os workflows do n8n seguindo a paginação por cursor"""
+        cursor = None
+        
         try:
-            response = self._make_request('GET', 'workflows')
-            
-            if response.status_code == 200:
+            while True:
+                params = {'limit': limit}
+                if cursor:
+                    params['cursor'] = cursor
+                
+                response = self._make_request('GET', 'workflows', params=params)
+                
+                if response.status_code != 200:
+                    raise Exception(f"API Error: {response.status_code} - {response.text}")
+                
                 data = response.json()
                 workflows_data = data.get('data', []) if isinstance(data, dict) else data
                 
-                workflows = []
                 for wf in workflows_data:
-                    workflows.append(WorkflowInfo(
-                        id=wf.get('id'),
-                        name=wf.get('name'),
-                        active=wf.get('active', False),
-                        created_at=wf.get('createdAt'),
-                        updated_at=wf.get('updatedAt'),
-                        is_archived=wf.get('isArchived', False)
-                    ))
+                    yield self._to_workflow_info(wf)
                 
-                return workflows
-            else:
-                raise Exception(f"API Error: {response.status_code} - {response.text}")
+                # Próxima página (ausente na última página)
+                cursor = data.get('nextCursor') if isinstance(data, dict) else None
+                if not cursor:
+                    break
                 
         except requests.exceptions.ConnectionError:
             raise Exception(f"Não foi possível conectar ao n8n em {self.base_url}")
         except requests.exceptions.Timeout:
-            raise Exception("Timeout: n8n não respondeu em 10 segundos")
+            raise Exception(f"Timeout: n8n não respondeu em {self.http.read_timeout:g} segundos")
+    
+    def get_all_workflows(self) -> Optional[List[WorkflowInfo]]:
+        """Busca todos os workflows do n8n"""
+        return list(self.iter_workflows())
+    
+    def _to_workflow_info(self, wf: Dict) -> WorkflowInfo:
+        """Converte item da API em WorkflowInfo"""
+        return WorkflowInfo(
+            id=wf.get('id'),
+            name=wf.get('name'),
+            active=wf.get('active', False),
+            created_at=wf.get('createdAt'),
+            updated_at=wf.get('updatedAt'),
+            is_archived=wf.get('isArchived', False)
+        )
     
     def get_workflow_by_id(self, workflow_id: str) -> Optional[Dict]:
         """Busca um workflow específico por ID"""
@@ -122,35 +205,40 @@ class WorkflowModel:
             raise Exception(f"Erro de conexão ao buscar workflow {workflow_id}: {e}")
     
     def _clean_workflow_data(self, workflow_data: Dict) -> Dict:
-        """Limpa dados do workflow removendo propriedades que causam problemas no upload"""
-        import copy
-        
-        # Criar cópia profunda para não modificar o original
-        clean_data = copy.deepcopy(workflow_data)
-        
+        """
+        Limpa dados do workflow removendo propriedades que causam problemas no upload
+        O original não é modificado: o resultado é uma cópia rasa que compartilha
+        parâmetros, código etc.; só nós e credenciais alterados são copiados
+        """
         # Remover campos do workflow principal (read-only ou gerados automaticamente)
-        fields_to_remove = [
-            'id', 'createdAt', 'updatedAt', 'shared', 'versionId', 'meta', 
-            'active', 'tags', 'pinData', 'triggerCount', 'isArchived'
-        ]
-        for field in fields_to_remove:
-            clean_data.pop(field, None)
+        clean_data = {k: v for k, v in workflow_data.items() if k not in UPLOAD_EXCLUDED_FIELDS}
         
         # Limpar nós individuais
-        if 'nodes' in clean_data and isinstance(clean_data['nodes'], list):
-            for node in clean_data['nodes']:
-                if isinstance(node, dict):
-                    # Remover id e webhookId dos nós
-                    node.pop('id', None)
-                    node.pop('webhookId', None)
-                    
-                    # Remover IDs de credenciais (serão reassociadas por nome)
-                    if 'credentials' in node and isinstance(node['credentials'], dict):
-                        for cred_type, cred_data in node['credentials'].items():
-                            if isinstance(cred_data, dict):
-                                cred_data.pop('id', None)
+        if isinstance(clean_data.get('nodes'), list):
+            clean_data['nodes'] = [self._clean_node(node) for node in clean_data['nodes']]
         
         return clean_data
+    
+    def _clean_node(self, node: Dict) -> Dict:
+        """Remove id/webhookId do nó e IDs de credenciais (reassociadas por nome)"""
+        if not isinstance(node, dict):
+            return node
+        
+        changes = {}
+        credentials = node.get('credentials')
+        if isinstance(credentials, dict) and any(isinstance(c, dict) and 'id' in c for c in credentials.values()):
+            changes['credentials'] = {
+                cred_type: ({k: v for k, v in cred_data.items() if k != 'id'}
+                            if isinstance(cred_data, dict) else cred_data)
+                for cred_type, cred_data in credentials.items()
+            }
+        
+        if not changes and 'id' not in node and 'webhookId' not in node:
+            return node
+        
+        clean_node = {k: v for k, v in node.items() if k not in NODE_EXCLUDED_FIELDS}
+        clean_node.update(changes)
+        return clean_node
 
     def create_workflow(self, workflow_data: Dict) -> Optional[Dict]:
         """Cria um novo workflow"""
@@ -219,41 +307,30 @@ class WorkflowModel:
     
     # Métodos para arquivos locais
     
-    def get_local_workflows(self) -> List[Dict]:
-        """Lista workflows locais na pasta workflows/"""
-        import glob
-        
-        workflow_files = glob.glob(os.path.join(self.workflows_dir, "*.json"))
-        workflows = []
-        
-        for filepath in workflow_files:
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # Extrair ID do nome do arquivo se possível
-                filename = os.path.basename(filepath)
-                workflow_id = self.extract_id_from_filename(filename)
-                
-                workflows.append({
-                    'filepath': filepath,
-                    'filename': filename,
-                    'id': data.get('id', workflow_id),
-                    'name': data.get('name', 'Unknown'),
-                    'active': data.get('active', False),
-                    'data': data
-                })
-                
-            except Exception as e:
-                print(f"Erro ao ler {filepath}: {e}")
-                continue
-        
+    def find_local_workflow_by_id(self, workflow_id: str) -> Optional[LocalWorkflow]:
+        """Localiza workflow local pelo ID (lê um único arquivo)"""
+        return self.local_index.find_by_id(workflow_id)
+    
+    def save_state(self):
+        """Persiste o estado interno (fingerprints remotos e manifesto local)"""
+        self.remote_fingerprints.save()
+        self.local_index.save()
+    
+    def get_local_workflows(self, include_data: bool = False) -> List[LocalWorkflow]:
+        """
+        Lista workflows locais na pasta workflows/
+        Metadados vêm do manifesto; o conteúdo (LocalWorkflow.data) é lido sob
+        demanda, ou já na listagem com include_data=True
+        """
+        workflows = self.local_index.scan()
+        if include_data:
+            for wf in workflows:
+                wf.load()
         return workflows
     
     def extract_id_from_filename(self, filename: str) -> Optional[str]:
         """Extrai ID do workflow do nome do arquivo (formato: nome_ID.json)"""
-        match = re.search(r'_([a-zA-Z0-9]+)\.json$', filename)
-        return match.group(1) if match else None
+        return extract_workflow_id(filename)
     
     def generate_filename(self, workflow_name: str, workflow_id: str) -> str:
         """Gera nome de arquivo padrão para um workflow"""
@@ -276,8 +353,11 @@ class WorkflowModel:
         
         filepath = os.path.join(self.workflows_dir, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(workflow_data, f, indent=2, ensure_ascii=False)
+        # Escrita atômica; conteúdo idêntico não é regravado (evita eventos do watchdog)
+        write_file_atomic(filepath, json_codec.dumps_pretty(workflow_data))
+        self.local_index.update(filepath, workflow_data)
+        if self.write_intents is not None:
+            self.write_intents.record(filepath)
         
         return filepath
     
@@ -289,7 +369,6 @@ class WorkflowModel:
             return None
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return json_codec.load_file(filepath)
         except Exception:
             return None
\ No newline at end of file
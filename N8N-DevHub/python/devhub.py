@@ -5,6 +5,7 @@ Script principal de linha de comando
 """
 
 import sys
+import json
 import argparse
 import time
 from datetime import datetime
@@ -35,7 +36,8 @@ class DevHub:
             auth_type = "API Key" if 'X-N8N-API-KEY' in self.model.headers else \
                        "Basic Auth" if 'Authorization' in self.model.headers else \
                        "Nenhuma"
-            self.view.print_connection_info(self.model.base_url, auth_type)
+            if not args.json:
+                self.view.print_connection_info(self.model.base_url, auth_type)
             
             # Executar comando
             command = args.command.replace('-', '_')
@@ -47,6 +49,10 @@ class DevHub:
             else:
                 self.view.print_error(f"Comando '{args.command}' não encontrado")
                 self.cmd_help(args)
+            
+            # Estatísticas do pool HTTP
+            if args.stats:
+                self.view.print_http_stats(self.model.get_http_stats())
                 
         except KeyboardInterrupt:
             print("\n\nOperação cancelada pelo usuário.")
@@ -59,7 +65,7 @@ class DevHub:
     def cmd_list(self, args):
         """Lista workflows remotos"""
         try:
-            workflows = self.controller.list_remote_workflows(
+            workflows = self.controller.iter_remote_workflows(
                 active_only=args.active,
                 inactive_only=args.inactive
             )
@@ -70,7 +76,7 @@ class DevHub:
             elif args.inactive:
                 title += " (Inativos)"
                 
-            self.view.print_workflow_list(workflows, title)
+            self.view.print_workflow_stream(workflows, title)
             
         except Exception as e:
             self.view.print_error(str(e))
@@ -100,13 +106,26 @@ class DevHub:
         """Alias para status"""
         self.cmd_status(args)
     
+    def cmd_diff(self, args):
+        """Mostra diferenças estruturais local vs remoto"""
+        try:
+            results = self.controller.diff_local_remote(args.identifier, by_id=args.by_id, jobs=args.jobs)
+            if args.json:
+                print(json.dumps(results, indent=2, ensure_ascii=False))
+            else:
+                self.view.print_workflow_diffs(results)
+        except Exception as e:
+            self.view.print_error(str(e))
+    
     # Comandos de download
     def cmd_download_all(self, args):
         """Baixa todos os workflows"""
         try:
             success_count, total_count, errors = self.controller.download_all_workflows(
                 active_only=args.active,
-                inactive_only=args.inactive
+                inactive_only=args.inactive,
+                jobs=args.jobs,
+                progress_callback=self.view.print_progress
             )
             
             operation = "Download"
@@ -178,7 +197,11 @@ class DevHub:
     def cmd_upload_all(self, args):
         """Envia todos os workflows locais"""
         try:
-            success_count, total_count, errors = self.controller.upload_all_workflows()
+            success_count, total_count, errors = self.controller.upload_all_workflows(
+                jobs=args.jobs,
+                progress_callback=self.view.print_progress,
+                force=args.force
+            )
             self.view.print_operation_summary(success_count, total_count, "Upload", errors)
             
         except Exception as e:
@@ -196,7 +219,7 @@ class DevHub:
             
         try:
             success, message = self.controller.upload_workflow(
-                args.identifier, by_filename=True
+                args.identifier, by_filename=True, force=args.force
             )
             
             if success:
@@ -215,7 +238,7 @@ class DevHub:
             
         try:
             success, message = self.controller.upload_workflow(
-                args.identifier, by_filename=False
+                args.identifier, by_filename=False, force=args.force
             )
             
             if success:
@@ -299,7 +322,7 @@ class DevHub:
             
         try:
             matches = self.controller.find_workflow_by_name(
-                args.identifier, fuzzy=not args.exact
+                args.identifier, fuzzy=not args.exact, tolerate_typos=True
             )
             
             if matches:
@@ -410,6 +433,14 @@ class DevHub:
         print(f"📊 Workflows Monitorados: {status['workflows_monitored']}")
         print(f"⚠️ Conflitos Ativos: {status['conflicts']}")
         print(f"🔄 Sincronizando: {status['syncing']}")
+        print(f"📥 Eventos na fila: {status['queue_depth']}")
+        print(f"🔁 Ecos ignorados: {status['echoes_suppressed']}")
+        
+        latency = status['latency']
+        if latency['events_processed']:
+            print(f"⏱️ Latência de propagação: média {latency['avg']:.2f}s, "
+                  f"p95 {latency['p95']:.2f}s, máx {latency['max']:.2f}s "
+                  f"({latency['events_processed']} eventos)")
         print()
         
         if status['states']:
@@ -510,7 +541,13 @@ def main():
     parser.add_argument('--exact', action='store_true',
                        help='Busca exata (padrão é aproximada)')
     parser.add_argument('--force', action='store_true',
-                       help='Força operação sem confirmação')
+                       help='Força operação sem confirmação (e reenvia workflows inalterados)')
+    parser.add_argument('--stats', action='store_true',
+                       help='Mostra estatísticas do pool de conexões HTTP')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Operações em paralelo para download-all/upload-all/diff (padrão: 1)')
+    parser.add_argument('--json', action='store_true',
+                       help='Saída em JSON (diff)')
     
     # Opções de sincronização
     parser.add_argument('--poll-interval', type=int, default=10,
@@ -0,0 +1,148 @@
+"""
+N8N-DevHub - Testes
+Configuração comum (módulos importados como no devhub.py: utils, models, ...)
+e um servidor n8n falso em memória para os testes de controller/model
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+
+# Adicionar o diretório N8N-DevHub ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from controllers.workflow_controller import WorkflowController  # noqa: E402
+from models.workflow_model import WorkflowModel  # noqa: E402
+
+
+def make_workflow(name: str, value: int = 0) -> dict:
+    """Workflow pequeno com gatilho e um nó Set conectado"""
+    return {
+        'name': name,
+        'nodes': [
+            {'name': 'Start', 'type': 'n8n-nodes-base.manualTrigger', 'parameters': {}, 'position': [0, 0]},
+            {'name': 'Set', 'type': 'n8n-nodes-base.set', 'parameters': {'value': value}, 'position': [200, 0]},
+        ],
+        'connections': {'Start': {'main': [[{'node': 'Set', 'type': 'main', 'index': 0}]]}},
+        'settings': {},
+    }
+
+
+class FakeN8N:
+    """API REST mínima do n8n (workflows) com registro das requisições recebidas"""
+
+    def __init__(self):
+        self.workflows = {}
+        self.requests = []        # [(método, caminho)]
+        self.forced_status = []   # próximas respostas com status fixo: [(status, headers)]
+        self.lock = threading.Lock()
+        self._next_id = 0
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+
+    def add(self, body: dict) -> dict:
+        self._next_id += 1
+        now = time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
+        workflow = dict(body, id=f"wf{self._next_id:04d}", active=False, createdAt=now, updatedAt=now)
+        self.workflows[workflow['id']] = workflow
+        return workflow
+
+    def count(self, method: str, path: str = None) -> int:
+        return sum(1 for m, p in self.requests if m == method and (path is None or p == path))
+
+    def _route(self, method: str, path: str, body):
+        parts = path.split('/')[3:]  # após /api/v1
+        if parts == ['workflows'] and method == 'GET':
+            return 200, {'data': list(self.workflows.values()), 'nextCursor': None}
+        if parts == ['workflows'] and method == 'POST':
+            return 200, self.add(body)
+        if len(parts) == 2 and parts[0] == 'workflows' and parts[1] in self.workflows:
+            workflow = self.workflows[parts[1]]
+            if method == 'PUT':
+                workflow.update({k: v for k, v in body.items() if k in ('name', 'nodes', 'connections', 'settings')})
+                workflow['updatedAt'] = time.strftime('%Y-%m-%dT%H:%M:%S.%fZ', time.gmtime())
+            return 200, workflow
+        return 404, {'message': 'not found'}
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self, method: str):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                path = urlparse(self.path).path
+                headers = {}
+                with fake.lock:
+                    fake.requests.append((method, path))
+                    if fake.forced_status:
+                        status, headers = fake.forced_status.pop(0)
+                        data = {'message': 'forced'}
+                    else:
+                        status, data = fake._route(method, path, body)
+
+                payload = json.dumps(data).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                self._handle('GET')
+
+            def do_POST(self):
+                self._handle('POST')
+
+            def do_PUT(self):
+                self._handle('PUT')
+
+        return Handler
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def n8n():
+    fake = FakeN8N()
+    yield fake
+    fake.close()
+
+
+@pytest.fixture
+def model(n8n, tmp_path, monkeypatch):
+    # Sem esperas de backoff nos testes
+    monkeypatch.setenv('N8N_RETRY_BACKOFF', '0')
+    monkeypatch.setenv('N8N_RATE_LIMIT', '0')
+    # Sem criar a pasta workflows/ padrão do projeto
+    with monkeypatch.context() as patch:
+        patch.setattr(os, 'makedirs', lambda *args, **kwargs: None)
+        workflow_model = WorkflowModel(base_url=n8n.url, api_key='test')
+    workflow_model.workflows_dir = str(tmp_path / 'workflows')
+    Path(workflow_model.workflows_dir).mkdir()
+    yield workflow_model
+    workflow_model.http.close()
+
+
+@pytest.fixture
+def controller(model):
+    return WorkflowController(model)
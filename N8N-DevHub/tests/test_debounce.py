@@ -0,0 +1,60 @@
+"""
+Testes do utils.debounce.DebounceScheduler
+"""
+
+import threading
+import time
+
+from utils.debounce import DebounceScheduler
+
+
+class Collector:
+    def __init__(self):
+        self.batches = []
+        self.event = threading.Event()
+
+    def __call__(self, batch):
+        self.batches.append(batch)
+        self.event.set()
+
+
+def test_repeated_touches_become_one_event_with_latest_value():
+    collector = Collector()
+    scheduler = DebounceScheduler(0.05, collector)
+    try:
+        for value in range(5):
+            scheduler.touch('a', value)
+        assert collector.event.wait(2)
+        time.sleep(0.1)
+        assert len(collector.batches) == 1
+        assert [(key, value) for key, value, _ in collector.batches[0]] == [('a', 4)]
+    finally:
+        scheduler.stop()
+
+
+def test_max_delay_bounds_continuous_touches():
+    collector = Collector()
+    scheduler = DebounceScheduler(0.2, collector, max_delay=0.3)
+    try:
+        start = time.monotonic()
+        while not collector.event.is_set() and time.monotonic() - start < 2:
+            scheduler.touch('a')
+            time.sleep(0.02)
+        assert collector.event.is_set()
+        assert time.monotonic() - start < 0.6
+    finally:
+        scheduler.stop()
+
+
+def test_drain_returns_pending_without_waiting():
+    collector = Collector()
+    scheduler = DebounceScheduler(60, collector)
+    try:
+        now = time.monotonic()
+        scheduler.touch('b', 2, at=now + 1)
+        scheduler.touch('a', 1, at=now)
+        assert scheduler.drain() == [('a', 1, now), ('b', 2, now + 1)]
+        assert len(scheduler) == 0
+        assert collector.batches == []
+    finally:
+        scheduler.stop()
@@ -0,0 +1,34 @@
+"""
+Testes do HTTPClient: novas tentativas em sobrecarga (429/503)
+"""
+
+import pytest
+
+from utils.http_client import is_throttle_retryable
+
+
+@pytest.mark.parametrize('method, status, retry_after, expected', [
+    ('GET', 503, None, True),
+    ('PUT', 503, None, True),
+    ('POST', 429, None, True),
+    ('POST', 503, 1.0, True),
+    ('POST', 503, None, False),
+    ('GET', 500, None, False),
+])
+def test_is_throttle_retryable(method, status, retry_after, expected):
+    assert is_throttle_retryable(method, status, retry_after) is expected
+
+
+def test_post_is_not_repeated_after_a_bare_503(n8n, model):
+    n8n.forced_status.append((503, {}))
+    response = model.http.request('POST', f"{n8n.url}/api/v1/workflows", json={'name': 'X'})
+    assert response.status_code == 503
+    assert n8n.count('POST') == 1
+    assert not n8n.workflows
+
+
+def test_post_is_repeated_after_429(n8n, model):
+    n8n.forced_status.append((429, {'Retry-After': '0'}))
+    response = model.http.request('POST', f"{n8n.url}/api/v1/workflows", json={'name': 'X'})
+    assert response.status_code == 200
+    assert n8n.count('POST') == 2
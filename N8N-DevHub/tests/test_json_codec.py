@@ -0,0 +1,52 @@
+"""
+Testes do utils.json_codec: mesmo resultado do json padrão em qualquer backend
+"""
+
+import json
+
+import pytest
+
+from utils import json_codec
+
+
+BIG_INTEGERS = [
+    18446744073709551616,           # 2**64
+    -9223372036854775809,           # abaixo de int64
+    123456789012345678901234567890,
+]
+
+SAMPLE = {
+    'name': 'Ação ✅',
+    'nodes': [{'name': 'Code', 'parameters': {'jsCode': 'return [];', 'limit': 10}}],
+    'values': [0, -1, 1.5, 1e-7, 1e20, 9223372036854775807, 18446744073709551615, None, True],
+}
+
+
+@pytest.mark.parametrize('value', BIG_INTEGERS)
+def test_loads_keeps_integers_beyond_64_bits(value):
+    text = json.dumps({'value': value})
+    assert json_codec.loads(text.encode()) == {'value': value}
+    assert type(json_codec.loads(text)['value']) is int
+
+
+@pytest.mark.parametrize('value', BIG_INTEGERS)
+def test_round_trip_keeps_integers_beyond_64_bits(value):
+    data = json_codec.loads(json_codec.dumps_pretty({'value': value}))
+    assert data == {'value': value}
+    assert type(data['value']) is int
+
+
+def test_loads_matches_stdlib():
+    text = json.dumps(SAMPLE, ensure_ascii=False)
+    assert json_codec.loads(text.encode('utf-8')) == json.loads(text)
+    assert json_codec.loads('[NaN, Infinity]')[1] == float('inf')
+
+
+def test_dumps_pretty_matches_stdlib():
+    expected = json.dumps(SAMPLE, indent=2, ensure_ascii=False).encode('utf-8')
+    assert json_codec.dumps_pretty(SAMPLE) == expected
+
+
+def test_dumps_canonical_matches_stdlib():
+    expected = json.dumps(SAMPLE, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    assert json_codec.dumps_canonical(SAMPLE) == expected
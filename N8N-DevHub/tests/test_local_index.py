@@ -0,0 +1,96 @@
+"""
+Testes do utils.local_index.LocalWorkflowIndex
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from conftest import make_workflow
+from utils.local_index import LocalWorkflowIndex
+
+
+@pytest.fixture
+def workflows_dir(tmp_path):
+    path = tmp_path / 'workflows'
+    path.mkdir()
+    return str(path)
+
+
+def write(workflows_dir: str, filename: str, workflow_id: str, value: int = 0) -> str:
+    filepath = os.path.join(workflows_dir, filename)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(dict(make_workflow(filename, value), id=workflow_id), f)
+    return filepath
+
+
+def make_index(workflows_dir: str, **kwargs) -> LocalWorkflowIndex:
+    return LocalWorkflowIndex(workflows_dir, os.path.join(workflows_dir, '.devhub', 'manifest.json'), **kwargs)
+
+
+def test_unchanged_files_are_not_reread(workflows_dir, monkeypatch):
+    filepath = write(workflows_dir, 'A_wf1.json', 'wf1')
+    os.utime(filepath, (1_700_000_000, 1_700_000_000))  # fora da janela "racy"
+    make_index(workflows_dir).scan()
+
+    read = []
+    monkeypatch.setattr('utils.local_index._read_entries', lambda directory, names: read.extend(names) or [])
+    assert [wf.id for wf in make_index(workflows_dir).scan()] == ['wf1']
+    assert read == []
+
+
+def test_cached_data_is_evicted_when_the_file_changes(workflows_dir):
+    filepath = write(workflows_dir, 'A_wf1.json', 'wf1', value=1)
+    index = make_index(workflows_dir, max_data_bytes=1024 * 1024)
+    record = index.scan()[0]
+    assert record.data['nodes'][1]['parameters']['value'] == 1
+
+    write(workflows_dir, 'A_wf1.json', 'wf1', value=2)
+    index.update(filepath)
+
+    assert record.data['nodes'][1]['parameters']['value'] == 2
+
+
+def test_duplicate_ids_resolve_to_first_filename_before_and_after_restart(workflows_dir):
+    write(workflows_dir, 'b_wf1.json', 'wf1')
+    write(workflows_dir, 'a_wf1.json', 'wf1')
+    index = make_index(workflows_dir)
+    index.scan()
+    # Regravar o segundo arquivo não muda a resposta
+    index.update(write(workflows_dir, 'b_wf1.json', 'wf1', value=3))
+    assert index.find_by_id('wf1').filename == 'a_wf1.json'
+    index.save()
+
+    assert make_index(workflows_dir).find_by_id('wf1').filename == 'a_wf1.json'
+
+    os.remove(os.path.join(workflows_dir, 'a_wf1.json'))
+    index.remove(os.path.join(workflows_dir, 'a_wf1.json'))
+    assert index.find_by_id('wf1').filename == 'b_wf1.json'
+
+
+def test_parallel_scan_uses_spawned_processes(workflows_dir, monkeypatch):
+    for i in range(100):
+        write(workflows_dir, f"W_wf{i:03d}.json", f"wf{i:03d}", value=i)
+    monkeypatch.setenv('N8N_PARALLEL_SCAN_THRESHOLD', '10')
+    monkeypatch.setenv('N8N_SCAN_WORKERS', '2')
+
+    methods = []
+
+    def pool(**kwargs):
+        methods.append(kwargs['mp_context'].get_start_method())
+        return ProcessPoolExecutor(**kwargs)
+
+    monkeypatch.setattr('utils.local_index.ProcessPoolExecutor', pool)
+
+    # Como no sync: varredura em uma thread secundária
+    results = []
+    thread = threading.Thread(target=lambda: results.extend(make_index(workflows_dir).scan()))
+    thread.start()
+    thread.join(60)
+
+    assert methods == ['spawn']
+    assert [wf.id for wf in results] == [f"wf{i:03d}" for i in range(100)]
+    assert results[7].data['nodes'][1]['parameters']['value'] == 7
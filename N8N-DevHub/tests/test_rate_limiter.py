@@ -0,0 +1,41 @@
+"""
+Testes do utils.rate_limiter
+"""
+
+from utils.rate_limiter import AdaptiveRateLimiter, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('3') == 3.0
+    assert parse_retry_after('-1') == 0.0
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+    assert parse_retry_after('invalid') is None
+    assert parse_retry_after(None) is None
+
+
+def test_throttle_halves_and_recovery_grows():
+    limiter = AdaptiveRateLimiter(max_rate=20, max_concurrency=8)
+    assert limiter.try_acquire() == 0.0
+    limiter.release(429, retry_after=0)
+
+    stats = limiter.get_stats()
+    assert stats['concurrency'] == 4
+    assert stats['rate'] == 10
+    assert stats['throttled_total'] == 1
+
+    # Respostas saudáveis: +1 req/s por resposta até o máximo
+    for _ in range(15):
+        limiter.release(200)
+    assert limiter.get_stats()['rate'] == 20
+
+
+def test_retry_after_blocks_new_requests():
+    limiter = AdaptiveRateLimiter(max_rate=0, max_concurrency=4)
+    limiter.try_acquire()
+    limiter.release(503, retry_after=5)
+    assert limiter.try_acquire() > 4
+
+
+def test_default_rate_limit(monkeypatch):
+    monkeypatch.delenv('N8N_RATE_LIMIT', raising=False)
+    assert AdaptiveRateLimiter().max_rate == 50
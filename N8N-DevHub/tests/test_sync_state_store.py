@@ -0,0 +1,44 @@
+"""
+Testes do utils.sync_state_store.SyncStateStore
+"""
+
+from conftest import make_workflow
+from utils.sync_state_store import SyncStateStore, decode_fingerprint, encode_fingerprint
+from utils.workflow_hash import HASH_VERSION, calculate_workflow_fingerprint
+
+
+def record(workflow_id: str, **fields) -> dict:
+    fingerprint = calculate_workflow_fingerprint(make_workflow(workflow_id))
+    base = {
+        'workflow_id': workflow_id, 'name': workflow_id,
+        'local_hash': fingerprint.root, 'remote_hash': fingerprint.root, 'base_hash': fingerprint.root,
+        'local_updated': '2026-01-01T00:00:00', 'remote_updated': None, 'last_sync': None,
+        'local_fingerprint': encode_fingerprint(fingerprint), 'remote_fingerprint': None,
+        'hash_version': HASH_VERSION
+    }
+    base.update(fields)
+    return base
+
+
+def test_round_trip(tmp_path):
+    store = SyncStateStore(str(tmp_path / 'sync.db'))
+    store.save_many([record('a'), record('b')])
+    store.delete('b')
+    store.close()
+
+    loaded = SyncStateStore(str(tmp_path / 'sync.db')).load()
+
+    assert list(loaded) == ['a']
+    assert loaded['a'] == record('a')
+    assert decode_fingerprint(loaded['a']['local_fingerprint']) == calculate_workflow_fingerprint(make_workflow('a'))
+
+
+def test_hashes_from_another_version_are_dropped(tmp_path):
+    store = SyncStateStore(str(tmp_path / 'sync.db'))
+    store.save(record('a', hash_version=HASH_VERSION - 1))
+
+    loaded = store.load()['a']
+
+    assert loaded['local_hash'] is None and loaded['base_hash'] is None
+    assert loaded['local_fingerprint'] is None
+    assert loaded['local_updated'] == '2026-01-01T00:00:00'
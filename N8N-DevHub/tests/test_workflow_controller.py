@@ -0,0 +1,113 @@
+"""
+Testes do WorkflowController: requisições feitas por upload e cache da listagem
+"""
+
+import json
+import os
+
+from conftest import make_workflow
+
+
+def write_local(model, filename: str, data: dict) -> str:
+    filepath = os.path.join(model.workflows_dir, filename)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    return filepath
+
+
+def test_upload_new_workflow_uses_create_response(n8n, model, controller):
+    original = write_local(model, 'rascunho.json', make_workflow('Novo Fluxo'))
+
+    success, message = controller.upload_workflow('rascunho.json')
+
+    assert success, message
+    assert controller.last_request_count == 1
+    assert n8n.requests == [('POST', '/api/v1/workflows')]
+
+    # Arquivo local refeito a partir da resposta do create, no padrão nome_ID.json
+    workflow_id = next(iter(n8n.workflows))
+    assert not os.path.exists(original)
+    assert os.path.exists(os.path.join(model.workflows_dir, f"Novo_Fluxo_{workflow_id}.json"))
+    assert model.find_local_workflow_by_id(workflow_id).filename == f"Novo_Fluxo_{workflow_id}.json"
+
+
+def edit_local(model, filepath: str, value: int):
+    data = model.load_workflow_from_file(os.path.basename(filepath))
+    data['nodes'][1]['parameters']['value'] = value
+    write_local(model, os.path.basename(filepath), data)
+
+
+def test_upload_existing_workflow_with_cold_cache(n8n, model, controller):
+    remote = n8n.add(make_workflow('Existente'))
+    success, _, filepath = controller.download_workflow(remote['id'], by_id=True)
+    assert success
+    edit_local(model, filepath, 42)
+    n8n.requests.clear()
+
+    success, message = controller.upload_workflow(os.path.basename(filepath))
+
+    # Uma consulta pelo ID (não a listagem completa) e o PUT; nenhum GET de refresh
+    assert success, message
+    path = f"/api/v1/workflows/{remote['id']}"
+    assert n8n.requests == [('GET', path), ('PUT', path)]
+    assert controller.last_request_count == 2
+    assert n8n.workflows[remote['id']]['nodes'][1]['parameters']['value'] == 42
+
+
+def test_upload_existing_workflow_with_listing_cached(n8n, model, controller):
+    remote = n8n.add(make_workflow('Existente'))
+    _, _, filepath = controller.download_workflow(remote['id'], by_id=True)
+    controller.list_remote_workflows()
+    path = f"/api/v1/workflows/{remote['id']}"
+
+    for value in (1, 2):
+        edit_local(model, filepath, value)
+        n8n.requests.clear()
+        success, message = controller.upload_workflow(os.path.basename(filepath))
+
+        # O upload atualiza a listagem em cache em vez de descartá-la
+        assert success, message
+        assert n8n.requests == [('PUT', path)]
+
+
+def test_reverted_edit_is_uploaded_by_id(n8n, model, controller):
+    remote = n8n.add(make_workflow('Revertido', value=0))
+    _, _, filepath = controller.download_workflow(remote['id'], by_id=True)
+
+    edit_local(model, filepath, 42)
+    success, message = controller.upload_workflow(remote['id'], by_filename=False)
+    assert success, message
+    assert n8n.workflows[remote['id']]['nodes'][1]['parameters']['value'] == 42
+
+    edit_local(model, filepath, 0)
+    success, message = controller.upload_workflow(remote['id'], by_filename=False)
+    assert success, message
+    assert 'inalterado' not in message
+    assert n8n.workflows[remote['id']]['nodes'][1]['parameters']['value'] == 0
+
+    # Reenviar a mesma versão é ignorado
+    success, message = controller.upload_workflow(remote['id'], by_filename=False)
+    assert 'inalterado' in message
+
+
+def test_upload_unchanged_workflow_is_skipped(n8n, model, controller):
+    remote = n8n.add(make_workflow('Parado'))
+    _, _, filepath = controller.download_workflow(remote['id'], by_id=True)
+    n8n.requests.clear()
+
+    success, message = controller.upload_workflow(os.path.basename(filepath))
+
+    assert success
+    assert 'inalterado' in message
+    assert n8n.count('PUT') == 0
+
+
+
+def test_listing_is_not_cached_over_an_invalidation(n8n, controller):
+    n8n.add(make_workflow('A'))
+    listing = controller.iter_remote_workflows()
+    next(listing)
+    controller.remote_cache.invalidate()
+    list(listing)
+
+    assert controller.remote_cache.get() is None
@@ -0,0 +1,51 @@
+"""
+Testes do utils.workflow_diff: diferença estrutural entre versões
+"""
+
+import copy
+
+from conftest import make_workflow
+from utils.workflow_diff import diff_workflows
+
+
+def test_equal_workflows():
+    workflow = make_workflow('A')
+    assert diff_workflows(workflow, copy.deepcopy(workflow))['equal']
+
+
+def test_parameter_change_reports_path():
+    old = make_workflow('A')
+    new = copy.deepcopy(old)
+    new['nodes'][1]['parameters']['value'] = 5
+
+    result = diff_workflows(old, new)
+
+    assert not result['equal']
+    assert result['nodes']['modified'] == [{
+        'name': 'Set', 'type': 'n8n-nodes-base.set',
+        'changes': [{'path': 'parameters.value', 'old': 0, 'new': 5, 'change': 'modified'}]
+    }]
+
+
+def test_rename_is_detected():
+    old = make_workflow('A')
+    new = copy.deepcopy(old)
+    new['nodes'][1]['name'] = 'Definir'
+    new['connections']['Start']['main'][0][0]['node'] = 'Definir'
+
+    result = diff_workflows(old, new)
+
+    assert result['nodes']['renamed'] == [{'old': 'Set', 'new': 'Definir'}]
+    assert result['nodes']['added'] == [] and result['nodes']['removed'] == []
+    assert [e['target'] for e in result['connections']['added']] == ['Definir']
+    assert [e['target'] for e in result['connections']['removed']] == ['Set']
+
+
+def test_settings_and_fields():
+    old = make_workflow('A')
+    new = dict(copy.deepcopy(old), name='B', settings={'timezone': 'UTC'})
+
+    result = diff_workflows(old, new)
+
+    assert result['fields'] == [{'path': 'name', 'old': 'A', 'new': 'B', 'change': 'modified'}]
+    assert result['settings'] == [{'path': 'timezone', 'old': None, 'new': 'UTC', 'change': 'added'}]
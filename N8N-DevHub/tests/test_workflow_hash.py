@@ -0,0 +1,50 @@
+"""
+Testes do utils.workflow_hash: invariantes do fingerprint
+"""
+
+import copy
+
+from conftest import make_workflow
+from utils.workflow_hash import calculate_workflow_fingerprint, calculate_workflow_hash, diff_fingerprints
+
+
+def test_volatile_fields_do_not_change_the_hash():
+    workflow = make_workflow('A')
+    touched = dict(workflow, updatedAt='2026-01-01T00:00:00Z', versionId='v9', createdAt='x', shared=[])
+    assert calculate_workflow_hash(workflow) == calculate_workflow_hash(touched)
+
+
+def test_key_and_node_order_do_not_change_the_hash():
+    workflow = make_workflow('A')
+    reordered = dict(reversed(list(workflow.items())))
+    reordered['nodes'] = list(reversed(workflow['nodes']))
+    assert calculate_workflow_hash(workflow) == calculate_workflow_hash(reordered)
+
+
+def test_absent_and_empty_structures_differ():
+    assert calculate_workflow_hash({'name': 'A'}) != calculate_workflow_hash({'name': 'A', 'nodes': []})
+    assert calculate_workflow_hash({'name': 'A'}) != calculate_workflow_hash({'name': 'A', 'connections': {}})
+    assert calculate_workflow_hash({'name': 'A'}) != calculate_workflow_hash({'name': 'A', 'settings': {}})
+
+
+def test_node_edit_changes_only_that_node():
+    old = make_workflow('A')
+    new = copy.deepcopy(old)
+    new['nodes'][1]['parameters']['value'] = 1
+
+    old_fp, new_fp = calculate_workflow_fingerprint(old), calculate_workflow_fingerprint(new)
+
+    assert old_fp.root != new_fp.root
+    assert old_fp.nodes['Start'] == new_fp.nodes['Start']
+    assert old_fp.connections == new_fp.connections
+    assert diff_fingerprints(old_fp, new_fp) == {
+        'added': [], 'removed': [], 'modified': ['Set'], 'connections': [],
+        'settings': False, 'other': False
+    }
+
+
+def test_duplicate_node_names_are_kept_apart():
+    workflow = make_workflow('A')
+    workflow['nodes'].append(dict(workflow['nodes'][1], parameters={'value': 2}))
+    fingerprint = calculate_workflow_fingerprint(workflow)
+    assert len(fingerprint.nodes) == 3
@@ -0,0 +1,114 @@
+"""
+N8N-DevHub - Debounce
+Agrupamento de eventos repetidos por chave numa única thread agendadora
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class DebounceScheduler:
+    """
+    Cada chave é liberada após window segundos sem novos eventos (ou após
+    max_delay desde o primeiro, se definido), com o valor mais recente.
+    Chaves que venceriam dentro de batch_grace saem no mesmo lote, de forma
+    que uma rajada (ex.: git checkout) vira uma única chamada de callback.
+    callback(lote) recebe [(chave, valor, primeiro evento)] na thread agendadora.
+    """
+
+    def __init__(self, window: float, callback: Callable[[List[Tuple[Hashable, Any, float]]], None],
+                 max_delay: Optional[float] = None, batch_grace: Optional[float] = None,
+                 name: str = 'devhub-debounce'):
+        self.window = window
+        self.max_delay = max_delay
+        self.batch_grace = window / 2 if batch_grace is None else batch_grace
+        self.callback = callback
+        self.on_error: Optional[Callable[[Exception], None]] = None
+        self.name = name
+
+        self._cond = threading.Condition()
+        self._pending: Dict[Hashable, list] = {}  # chave -> [valor, primeiro, último]
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def touch(self, key: Hashable, value: Any = None, at: Optional[float] = None):
+        """Registra um evento da chave (reinicia a janela dela)"""
+        now = time.monotonic() if at is None else at
+        with self._cond:
+            entry = self._pending.get(key)
+            if entry is None:
+                self._pending[key] = [value, now, now]
+            else:
+                entry[0] = value
+                entry[2] = now
+            self._stopped = False
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def discard(self, key: Hashable):
+        with self._cond:
+            self._pending.pop(key, None)
+
+    def drain(self) -> List[Tuple[Hashable, Any, float]]:
+        """Remove e retorna todos os pendentes sem esperar a janela (ex.: ao encerrar)"""
+        with self._cond:
+            batch = [(key, value, first) for key, (value, first, _) in self._pending.items()]
+            self._pending.clear()
+        batch.sort(key=lambda item: item[2])
+        return batch
+
+    def stop(self):
+        """Encerra a thread descartando eventos pendentes"""
+        with self._cond:
+            self._stopped = True
+            self._pending.clear()
+            self._cond.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _deadline(self, entry: list) -> float:
+        _, first, last = entry
+        deadline = last + self.window
+        if self.max_delay is not None:
+            deadline = min(deadline, first + self.max_delay)
+        return deadline
+
+    def _take_due(self) -> Tuple[List[Tuple[Hashable, Any, float]], Optional[float]]:
+        """Lote vencido (com a folga) e quanto esperar pelo próximo"""
+        now = time.monotonic()
+        deadlines = {key: self._deadline(entry) for key, entry in self._pending.items()}
+        if not deadlines or min(deadlines.values()) > now:
+            return [], min(deadlines.values()) - now if deadlines else None
+
+        limit = now + self.batch_grace
+        batch = []
+        for key, deadline in deadlines.items():
+            if deadline <= limit:
+                value, first, _ = self._pending.pop(key)
+                batch.append((key, value, first))
+        batch.sort(key=lambda item: item[2])
+        return batch, None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopped:
+                        return
+                    batch, timeout = self._take_due()
+                    if batch:
+                        break
+                    self._cond.wait(timeout)
+
+            try:
+                self.callback(batch)
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(e)
@@ -0,0 +1,68 @@
+"""
+N8N-DevHub - File Utils
+Escrita atômica de arquivos (temporário + fsync + rename) e nomes de arquivo de workflows
+"""
+
+import os
+import re
+import threading
+from typing import Optional
+
+
+# Arquivos de workflow: nome_ID.json
+WORKFLOW_FILENAME_ID = re.compile(r'_([a-zA-Z0-9]+)\.json$')
+
+
+def extract_workflow_id(filename: str) -> Optional[str]:
+    """Extrai ID do workflow do nome do arquivo (formato: nome_ID.json)"""
+    match = WORKFLOW_FILENAME_ID.search(filename)
+    return match.group(1) if match else None
+
+
+def _same_content(filepath: str, data: bytes) -> bool:
+    """Compara o conteúdo atual do arquivo (tamanho primeiro, depois bytes)"""
+    try:
+        if os.path.getsize(filepath) != len(data):
+            return False
+        with open(filepath, 'rb') as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def write_file_atomic(filepath: str, data: bytes, skip_unchanged: bool = True) -> bool:
+    """
+    Grava data em filepath de forma atômica: o arquivo nunca fica pela metade
+    Escreve num temporário oculto no mesmo diretório, faz fsync e renomeia
+    por cima do destino, preservando as permissões do arquivo existente.
+    Returns: False se o conteúdo já era idêntico (nada foi escrito)
+    """
+    if skip_unchanged and _same_content(filepath, data):
+        return False
+
+    directory, filename = os.path.split(os.path.abspath(filepath))
+    # Prefixo '.' e sufixo '.tmp': ignorado pelos scanners de *.json
+    tmp_path = os.path.join(directory, f".{filename}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    try:
+        mode = os.stat(filepath).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o666  # sujeito à umask, como em open()
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), mode)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode != 0o666:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    return True
@@ -0,0 +1,77 @@
+"""
+N8N-DevHub - Fingerprint Store
+Último fingerprint conhecido de cada workflow no servidor
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+from utils import json_codec
+from utils.file_utils import write_file_atomic
+from utils.workflow_hash import HASH_VERSION, calculate_workflow_hash
+
+
+class RemoteFingerprintStore:
+    """Registro persistente (JSON) de hash e updatedAt remotos por ID de workflow"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                stored = json_codec.load_file(self.path)
+                if stored.get('version') == HASH_VERSION:
+                    self._entries = stored.get('workflows', {})
+            except (OSError, ValueError, AttributeError):
+                pass
+        return self._entries
+
+    def get(self, workflow_id: str) -> Optional[str]:
+        """Retorna o último hash remoto conhecido"""
+        with self._lock:
+            entry = self._load().get(workflow_id)
+            return entry.get('hash') if entry else None
+
+    def get_entry(self, workflow_id: str) -> Optional[Dict]:
+        """Retorna {'hash', 'updated_at'} do último estado remoto conhecido"""
+        with self._lock:
+            entry = self._load().get(workflow_id)
+            return dict(entry) if entry else None
+
+    def record(self, workflow_data: Dict, workflow_hash: str = None):
+        """Registra o estado remoto de um workflow (após download/upload)"""
+        workflow_id = workflow_data.get('id')
+        if not workflow_id:
+            return
+
+        entry = {
+            'hash': workflow_hash or calculate_workflow_hash(workflow_data),
+            'updated_at': workflow_data.get('updatedAt')
+        }
+        with self._lock:
+            self._load()[workflow_id] = entry
+            self._dirty = True
+
+    def forget(self, workflow_id: str):
+        """Remove registro de um workflow"""
+        with self._lock:
+            if self._load().pop(workflow_id, None) is not None:
+                self._dirty = True
+
+    def save(self):
+        """Persiste alterações pendentes em disco"""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            data = json.dumps({'version': HASH_VERSION, 'workflows': self._entries}, separators=(',', ':'))
+            write_file_atomic(self.path, data.encode('utf-8'))
+            self._dirty = False
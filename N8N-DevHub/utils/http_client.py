@@ -0,0 +1,236 @@
+"""
+N8N-DevHub - HTTP Client
+Camada de transporte HTTP com pool de conexões persistentes
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.rate_limiter import AdaptiveRateLimiter, THROTTLE_STATUS_CODES, parse_retry_after
+
+
+# Verbos idempotentes que podem ser repetidos com segurança
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'])
+
+# Status HTTP transitórios que justificam nova tentativa
+# (429/503 são tratados pelo rate limiter, que precisa enxergá-los)
+RETRY_STATUS_CODES = (500, 502, 504)
+
+
+def is_throttle_retryable(method: str, status: Optional[int], retry_after: Optional[float]) -> bool:
+    """
+    True se a resposta de sobrecarga pode ser repetida
+    Verbos não idempotentes só em 429 ou com Retry-After: um 503 de gateway pode
+    chegar depois que o servidor já processou a requisição (ex.: POST duplicado)
+    """
+    if status not in THROTTLE_STATUS_CODES:
+        return False
+    return method.upper() in IDEMPOTENT_METHODS or status == 429 or retry_after is not None
+
+
+def _env_float(name: str, default: float) -> float:
+    """Lê variável de ambiente numérica com fallback"""
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    """Lê variável de ambiente inteira com fallback"""
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class RequestCounter:
+    """Contador de requisições HTTP de uma operação"""
+
+    def __init__(self):
+        self.count = 0
+        self.by_method: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, method: str, attempts: int = 1):
+        with self._lock:
+            self.count += attempts
+            self.by_method[method] = self.by_method.get(method, 0) + attempts
+
+
+class HTTPClient:
+    """Sessão HTTP persistente com keep-alive, retries e timeouts separados"""
+
+    def __init__(self, headers: Dict[str, str] = None,
+                 connect_timeout: float = None, read_timeout: float = None,
+                 pool_connections: int = None, pool_maxsize: int = None,
+                 max_retries: int = None, backoff_factor: float = None):
+        # Timeouts: conexão e leitura independentes
+        self.connect_timeout = connect_timeout or _env_float('N8N_CONNECT_TIMEOUT', 5.0)
+        self.read_timeout = read_timeout or _env_float('N8N_READ_TIMEOUT', 10.0)
+
+        # Pool: quantidade de hosts e conexões mantidas por host
+        self.pool_connections = pool_connections or _env_int('N8N_POOL_CONNECTIONS', 4)
+        self.pool_maxsize = pool_maxsize or _env_int('N8N_POOL_SIZE', 10)
+
+        # Retries com backoff exponencial apenas para verbos idempotentes
+        self.max_retries = max_retries if max_retries is not None else _env_int('N8N_MAX_RETRIES', 3)
+        self.backoff_factor = backoff_factor if backoff_factor is not None else _env_float('N8N_RETRY_BACKOFF', 0.5)
+
+        # Limitador adaptativo: novas tentativas em 429/503 (ver is_throttle_retryable)
+        self.rate_limiter = AdaptiveRateLimiter()
+        self.max_throttle_retries = _env_int('N8N_THROTTLE_RETRIES', 5)
+
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._requests_total = 0
+        self._retries_total = 0
+        self._errors_total = 0
+
+        self._mount_adapter()
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """Timeout no formato (connect, read) aceito pelo requests"""
+        return (self.connect_timeout, self.read_timeout)
+
+    def _build_retry(self) -> Retry:
+        """Cria política de retry para o adapter"""
+        return Retry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=self.max_retries,
+            status=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=IDEMPOTENT_METHODS,
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+
+    def _mount_adapter(self):
+        """Monta adapter com pool dimensionado para http e https"""
+        self.adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self._build_retry()
+        )
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+
+    def resize_pool(self, pool_maxsize: int):
+        """Redimensiona o pool de conexões por host (ex: para operações paralelas)"""
+        if pool_maxsize <= self.pool_maxsize:
+            return
+
+        self.pool_maxsize = pool_maxsize
+        old_adapter = self.adapter
+        self._mount_adapter()
+        old_adapter.close()
+
+    @contextmanager
+    def track_requests(self, counter: RequestCounter = None) -> Iterator[RequestCounter]:
+        """
+        Conta as requisições feitas pela thread atual dentro do bloco.
+        Um counter existente pode ser reaproveitado por threads de trabalho.
+        """
+        counters = self._local.__dict__.setdefault('counters', [])
+        counter = counter or RequestCounter()
+        counters.append(counter)
+        try:
+            yield counter
+        finally:
+            counters.remove(counter)
+
+    def _count_request(self, method: str, attempts: int = 1):
+        for counter in getattr(self._local, 'counters', ()):
+            counter.add(method, attempts)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Executa requisição reaproveitando conexões do pool"""
+        kwargs.setdefault('timeout', self.timeout)
+        throttle_attempts = 0
+
+        while True:
+            self.rate_limiter.acquire()
+            status = None
+            retry_after = None
+
+            try:
+                response = self.session.request(method, url, **kwargs)
+                status = response.status_code
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            except requests.exceptions.RequestException:
+                with self._lock:
+                    self._requests_total += 1
+                    self._errors_total += 1
+                self._count_request(method)
+                raise
+            finally:
+                self.rate_limiter.release(status, retry_after)
+
+            retries = getattr(getattr(response.raw, 'retries', None), 'history', None) or ()
+            with self._lock:
+                self._requests_total += 1
+                self._retries_total += len(retries)
+            self._count_request(method, 1 + len(retries))
+
+            if (is_throttle_retryable(method, status, retry_after)
+                    and throttle_attempts < self.max_throttle_retries):
+                # O limiter aplica a espera (Retry-After/backoff) no próximo acquire
+                throttle_attempts += 1
+                with self._lock:
+                    self._retries_total += 1
+                response.close()
+                continue
+
+            return response
+
+    def get_pool_stats(self) -> Dict:
+        """Retorna estatísticas do pool de conexões e das requisições"""
+        pools = []
+        pool_manager = self.adapter.poolmanager
+
+        for key in list(pool_manager.pools.keys()):
+            pool = pool_manager.pools.get(key)
+            if pool is None:
+                continue
+
+            idle = 0
+            if pool.pool is not None:
+                idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+
+            pools.append({
+                'host': f"{pool.scheme}://{pool.host}:{pool.port}",
+                'connections_opened': pool.num_connections,
+                'requests': pool.num_requests,
+                'idle_connections': idle,
+                'maxsize': self.pool_maxsize
+            })
+
+        with self._lock:
+            return {
+                'requests_total': self._requests_total,
+                'retries_total': self._retries_total,
+                'errors_total': self._errors_total,
+                'connect_timeout': self.connect_timeout,
+                'read_timeout': self.read_timeout,
+                'pool_connections': self.pool_connections,
+                'pool_maxsize': self.pool_maxsize,
+                'pools': pools,
+                'rate_limiter': self.rate_limiter.get_stats()
+            }
+
+    def close(self):
+        """Fecha sessão e conexões abertas"""
+        self.session.close()
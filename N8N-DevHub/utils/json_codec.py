@@ -0,0 +1,100 @@
+"""
+N8N-DevHub - JSON Codec
+Serialização JSON de workflows com backend rápido (orjson) quando instalado
+"""
+
+import json
+import os
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# N8N_JSON_BACKEND=json força a biblioteca padrão
+BACKEND = 'orjson' if orjson is not None and os.getenv('N8N_JSON_BACKEND', 'auto') != 'json' else 'json'
+
+# Inteiros fora de 64 bits viram float no orjson (sem erro); todo float
+# com esse módulo pode ter vindo de um deles
+_INT64_LIMIT = 2.0 ** 63
+
+
+def _needs_stdlib(obj: Any) -> bool:
+    """
+    True se houver floats que o orjson formata diferente do json padrão
+    (notação exponencial, NaN e infinito)
+    """
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, float) and value != 0 and not (1e-4 <= abs(value) < 1e16):
+            return True
+    return False
+
+
+def _has_big_floats(obj: Any) -> bool:
+    """True se houver floats com |valor| >= 2**63 (possíveis inteiros convertidos)"""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, float) and abs(value) >= _INT64_LIMIT:
+            return True
+    return False
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decodifica JSON (mesmo resultado de json.loads)"""
+    if BACKEND == 'orjson':
+        try:
+            obj = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity: só o json padrão aceita
+            obj = None
+        else:
+            # Verificação após o parse: só floats enormes forçam a releitura
+            if not _has_big_floats(obj):
+                return obj
+    return json.loads(data)
+
+
+def load_file(filepath: str) -> Any:
+    """Lê e decodifica um arquivo JSON"""
+    with open(filepath, 'rb') as f:
+        return loads(f.read())
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """
+    Formato dos arquivos de workflow, em UTF-8
+    Idêntico byte a byte a json.dumps(obj, indent=2, ensure_ascii=False)
+    """
+    if BACKEND == 'orjson' and not _needs_stdlib(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def dumps_canonical(obj: Any) -> bytes:
+    """
+    Forma canônica usada em hashes (chaves ordenadas, sem espaços, UTF-8)
+    Idêntica byte a byte a json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    """
+    if BACKEND == 'orjson' and not _needs_stdlib(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    data = json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return data.encode('utf-8', 'surrogatepass')
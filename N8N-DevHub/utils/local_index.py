@@ -0,0 +1,397 @@
+"""
+N8N-DevHub - Local Index
+Manifesto persistente dos workflows locais (evita reprocessar arquivos inalterados)
+"""
+
+import json
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils import json_codec
+from utils.file_utils import extract_workflow_id, write_file_atomic
+from utils.workflow_hash import HASH_VERSION, calculate_workflow_hash
+
+
+# Versão do formato do manifesto (combinada com a versão do hash)
+MANIFEST_VERSION = 1
+
+# Arquivos modificados há menos que isso podem mudar sem alterar mtime/tamanho
+# (granularidade do sistema de arquivos); são reverificados no próximo scan
+RACY_WINDOW_NS = 2_000_000_000
+
+# Campos do manifesto expostos em LocalWorkflow
+METADATA_FIELDS = ('id', 'name', 'active', 'updated_at', 'hash', 'size')
+
+
+def build_entry(filename: str, data: Dict, stat: os.stat_result) -> Dict:
+    """Monta entrada do manifesto a partir do conteúdo e do stat do arquivo"""
+    return {
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'id': data.get('id', extract_workflow_id(filename)),
+        'name': data.get('name', 'Unknown'),
+        'active': data.get('active', False),
+        'updated_at': data.get('updatedAt'),
+        'hash': calculate_workflow_hash(data)
+    }
+
+
+def _read_entries(workflows_dir: str, filenames: List[str]) -> List[Tuple[str, Optional[Dict], Optional[str]]]:
+    """
+    Lê e indexa um lote de arquivos: (nome, entrada do manifesto, erro)
+    Roda também nos processos do pool; só metadados e hash voltam ao processo principal
+    """
+    results = []
+    for filename in filenames:
+        filepath = os.path.join(workflows_dir, filename)
+        try:
+            stat = os.stat(filepath)
+            results.append((filename, build_entry(filename, json_codec.load_file(filepath), stat), None))
+        except Exception as e:
+            results.append((filename, None, str(e)))
+    return results
+
+
+class LocalDataCache:
+    """LRU do conteúdo dos workflows locais, limitado pelo tamanho dos arquivos"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, filepath: str) -> Optional[Dict]:
+        with self._lock:
+            item = self._items.get(filepath)
+            if item is None:
+                return None
+            self._items.move_to_end(filepath)
+            return item[0]
+
+    def put(self, filepath: str, data: Dict, size: int):
+        with self._lock:
+            old = self._items.pop(filepath, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            if size > self.max_bytes:
+                return
+            self._items[filepath] = (data, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._items.popitem(last=False)
+                self.current_bytes -= evicted_size
+
+    def discard(self, filepath: str):
+        with self._lock:
+            old = self._items.pop(filepath, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+
+
+class LocalWorkflow:
+    """
+    Workflow local: metadados do manifesto e conteúdo carregado sob demanda.
+    Com data_cache o conteúdo fica no LRU compartilhado; sem ele, fica no
+    próprio objeto após o primeiro acesso.
+    """
+
+    __slots__ = ('filepath', 'filename', 'id', 'name', 'active', 'updated_at',
+                 'hash', 'size', '_data', '_data_cache')
+
+    def __init__(self, filepath: str, filename: str, id: Optional[str] = None,
+                 name: str = 'Unknown', active: bool = False, updated_at: Optional[str] = None,
+                 hash: Optional[str] = None, size: int = 0, data: Optional[Dict] = None,
+                 data_cache: Optional[LocalDataCache] = None):
+        self.filepath = filepath
+        self.filename = filename
+        self.id = id
+        self.name = name
+        self.active = active
+        self.updated_at = updated_at
+        self.hash = hash
+        self.size = size
+        self._data = None
+        self._data_cache = data_cache
+        if data is not None:
+            self._keep(data)
+
+    def _keep(self, data: Dict):
+        if self._data_cache is not None:
+            self._data_cache.put(self.filepath, data, self.size)
+        else:
+            self._data = data
+
+    @property
+    def data(self) -> Dict:
+        """Conteúdo completo do arquivo (lido do disco no primeiro acesso)"""
+        return self.load()
+
+    def load(self) -> Dict:
+        """Carrega o conteúdo (se ainda não estiver em memória) e o retorna"""
+        if self._data is not None:
+            return self._data
+        if self._data_cache is not None:
+            data = self._data_cache.get(self.filepath)
+            if data is not None:
+                return data
+
+        data = json_codec.load_file(self.filepath)
+        self._keep(data)
+        return data
+
+    def release(self):
+        """Descarta o conteúdo carregado"""
+        self._data = None
+        if self._data_cache is not None:
+            self._data_cache.discard(self.filepath)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in ('filepath', 'filename', 'data') or key in METADATA_FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Acesso no estilo dict (compatibilidade com o formato anterior)"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __repr__(self) -> str:
+        return f"LocalWorkflow(filename={self.filename!r}, id={self.id!r}, name={self.name!r})"
+
+
+class LocalWorkflowIndex:
+    """Manifesto (JSON) da pasta de workflows, indexado por nome de arquivo"""
+
+    def __init__(self, workflows_dir: str, manifest_path: str, max_data_bytes: int = None):
+        self.workflows_dir = workflows_dir
+        self.manifest_path = manifest_path
+
+        # Limite de memória para conteúdo carregado (0 = sem limite)
+        if max_data_bytes is None:
+            try:
+                max_data_bytes = int(float(os.getenv('N8N_LOCAL_CACHE_MB', 0)) * 1024 * 1024)
+            except ValueError:
+                max_data_bytes = 0
+        self.data_cache = LocalDataCache(max_data_bytes) if max_data_bytes > 0 else None
+
+        # Varredura em múltiplos processos a partir de N arquivos a reprocessar (0 = desativado)
+        try:
+            self.parallel_threshold = int(os.getenv('N8N_PARALLEL_SCAN_THRESHOLD', 500))
+        except ValueError:
+            self.parallel_threshold = 500
+        try:
+            self.max_workers = int(os.getenv('N8N_SCAN_WORKERS', 0)) or os.cpu_count() or 1
+        except ValueError:
+            self.max_workers = os.cpu_count() or 1
+
+        self._lock = threading.RLock()
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._by_id: Dict[str, str] = {}  # ID -> nome do arquivo
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                stored = json_codec.load_file(self.manifest_path)
+                if stored.get('version') == [MANIFEST_VERSION, HASH_VERSION]:
+                    self._entries = stored.get('files', {})
+            except (OSError, ValueError, AttributeError):
+                pass
+
+            for filename, entry in self._entries.items():
+                self._link_id(entry.get('id'), filename)
+        return self._entries
+
+    def _link_id(self, workflow_id: Optional[str], filename: str):
+        """Com IDs duplicados vale o primeiro arquivo em ordem alfabética"""
+        if not workflow_id:
+            return
+        current = self._by_id.get(workflow_id)
+        if current is None or filename < current:
+            self._by_id[workflow_id] = filename
+
+    def _unlink_id(self, workflow_id: Optional[str], filename: str):
+        """Remove o arquivo do índice por ID (outro arquivo com o mesmo ID assume)"""
+        if not workflow_id or self._by_id.get(workflow_id) != filename:
+            return
+        del self._by_id[workflow_id]
+        for other, entry in self._entries.items():
+            if other != filename and entry.get('id') == workflow_id:
+                self._link_id(workflow_id, other)
+
+    def _is_current(self, entry: Optional[Dict], stat: os.stat_result) -> bool:
+        return (entry is not None
+                and not entry.get('racy')
+                and entry['mtime_ns'] == stat.st_mtime_ns
+                and entry['size'] == stat.st_size)
+
+    def _discard_data(self, filename: str):
+        """Tira do LRU o conteúdo de um arquivo que mudou ou sumiu"""
+        if self.data_cache is not None:
+            self.data_cache.discard(os.path.join(self.workflows_dir, filename))
+
+    def _store(self, filename: str, entry: Dict):
+        if time.time_ns() - entry['mtime_ns'] < RACY_WINDOW_NS:
+            entry['racy'] = True
+        old = self._entries.get(filename)
+        self._entries[filename] = entry
+        self._discard_data(filename)
+        if old is not None and old.get('id') != entry.get('id'):
+            self._unlink_id(old.get('id'), filename)
+        self._link_id(entry.get('id'), filename)
+        self._dirty = True
+
+    def _drop(self, filename: str):
+        entry = self._entries.pop(filename, None)
+        self._discard_data(filename)
+        if entry is None:
+            return
+        self._unlink_id(entry.get('id'), filename)
+        self._dirty = True
+
+    def _record(self, filename: str, data: Optional[Dict] = None) -> LocalWorkflow:
+        metadata = {field: self._entries[filename].get(field) for field in METADATA_FIELDS}
+        return LocalWorkflow(os.path.join(self.workflows_dir, filename), filename,
+                             data=data, data_cache=self.data_cache, **metadata)
+
+    def _list_files(self) -> List[os.DirEntry]:
+        try:
+            with os.scandir(self.workflows_dir) as it:
+                files = [e for e in it
+                         if e.name.endswith('.json') and not e.name.startswith('.') and e.is_file()]
+        except FileNotFoundError:
+            return []
+        return sorted(files, key=lambda e: e.name)
+
+    def _scan_workers(self, file_count: int) -> int:
+        """Quantidade de processos para indexar file_count arquivos (1 = sequencial)"""
+        if self.parallel_threshold <= 0 or file_count < self.parallel_threshold:
+            return 1
+        return max(1, min(self.max_workers, file_count // 50))
+
+    def _read_files(self, filenames: List[str]) -> List[Tuple[str, Optional[Dict], Optional[str]]]:
+        """Indexa arquivos novos/modificados, em processos paralelos acima do limite"""
+        workers = self._scan_workers(len(filenames))
+        if workers <= 1:
+            return _read_entries(self.workflows_dir, filenames)
+
+        # Lotes menores que len/workers equilibram arquivos de tamanhos diferentes
+        chunk_size = -(-len(filenames) // (workers * 4))
+        chunks = [filenames[i:i + chunk_size] for i in range(0, len(filenames), chunk_size)]
+
+        try:
+            results = []
+            # spawn: o scan roda em threads do sync; fork copiaria locks de outras threads
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                for chunk_results in pool.map(_read_entries, repeat(self.workflows_dir), chunks):
+                    results.extend(chunk_results)
+            return results
+        except (OSError, BrokenProcessPool):
+            # Ambiente sem suporte a múltiplos processos
+            return _read_entries(self.workflows_dir, filenames)
+
+    def scan(self) -> List[LocalWorkflow]:
+        """
+        Lista workflows locais, reprocessando apenas arquivos novos ou modificados
+        O conteúdo é lido sob demanda (LocalWorkflow.data)
+        """
+        with self._lock:
+            entries = self._load()
+            files = self._list_files()
+
+            stale = []
+            for file_entry in files:
+                try:
+                    current = self._is_current(entries.get(file_entry.name), file_entry.stat())
+                except OSError:
+                    current = False
+                if not current:
+                    stale.append(file_entry.name)
+
+            for filename, entry, error in self._read_files(stale):
+                if error is None:
+                    self._store(filename, entry)
+                    continue
+                print(f"Erro ao ler {os.path.join(self.workflows_dir, filename)}: {error}")
+                self._drop(filename)
+
+            # Remover entradas de arquivos apagados
+            for filename in set(entries) - {file_entry.name for file_entry in files}:
+                self._drop(filename)
+
+            self.save()
+            return [self._record(file_entry.name) for file_entry in files if file_entry.name in entries]
+
+    def update(self, filepath: str, data: Optional[Dict] = None):
+        """
+        Atualiza a entrada de um arquivo recém-gravado ou alterado (sem varrer a pasta)
+        data: conteúdo já carregado, se disponível (evita reler o arquivo)
+        """
+        filename = os.path.basename(filepath)
+        with self._lock:
+            entries = self._load()
+            try:
+                stat = os.stat(filepath)
+                if self._is_current(entries.get(filename), stat):
+                    return
+                if data is None:
+                    data = json_codec.load_file(filepath)
+                self._store(filename, build_entry(filename, data, stat))
+            except (OSError, ValueError):
+                self._drop(filename)
+
+    def remove(self, filepath: str):
+        """Remove a entrada de um arquivo apagado ou movido"""
+        with self._lock:
+            self._load()
+            self._drop(os.path.basename(filepath))
+
+    def find_by_id(self, workflow_id: str) -> Optional[LocalWorkflow]:
+        """
+        Localiza um workflow pelo ID lendo apenas o arquivo correspondente
+        A pasta só é varrida se o ID não estiver no índice ou o arquivo tiver mudado de ID
+        Returns: LocalWorkflow com o conteúdo já carregado, ou None
+        """
+        with self._lock:
+            self._load()
+            for attempt in range(2):
+                filename = self._by_id.get(workflow_id)
+                if filename is not None:
+                    filepath = os.path.join(self.workflows_dir, filename)
+                    try:
+                        data = json_codec.load_file(filepath)
+                    except (OSError, ValueError):
+                        data = None
+
+                    if data is not None:
+                        self.update(filepath, data)
+                        if self._by_id.get(workflow_id) == filename:
+                            return self._record(filename, data)
+
+                if attempt == 0:
+                    self.scan()
+            return None
+
+    def save(self):
+        """Persiste o manifesto se houver alterações"""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+            data = json.dumps({'version': [MANIFEST_VERSION, HASH_VERSION], 'files': self._entries},
+                              separators=(',', ':'))
+            write_file_atomic(self.manifest_path, data.encode('utf-8'))
+            self._dirty = False
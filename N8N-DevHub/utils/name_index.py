@@ -0,0 +1,173 @@
+"""
+N8N-DevHub - Name Index
+Índice de trigramas dos nomes de workflows (busca por substring e tolerante a erros)
+"""
+
+import heapq
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from models.workflow_model import WorkflowInfo
+
+
+# Fração mínima dos trigramas da busca presentes no nome (busca tolerante a erros)
+MIN_TYPO_SIMILARITY = 0.4
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Trigramas do texto com um espaço de cada lado (marca início/fim de palavra)"""
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class WorkflowNameIndex:
+    """
+    Índice invertido trigrama -> IDs, atualizado incrementalmente a cada
+    nova listagem (só nomes novos, alterados ou removidos mudam o índice).
+    Os trigramas só são montados a partir da segunda busca: uma busca única
+    (ex.: um comando da CLI) faz apenas a varredura linear.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._workflows: Dict[str, WorkflowInfo] = {}
+        self._names: Dict[str, str] = {}             # ID -> nome em minúsculas
+        self._postings: Optional[Dict[str, Set[str]]] = None  # trigrama -> IDs
+        self._by_exact_name: Dict[str, Set[str]] = {}
+        self._searches = 0
+
+        # Versão do cache da listagem refletida no índice
+        self.version: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._workflows)
+
+    def _add(self, workflow_id: str, name: str):
+        name_lower = name.lower()
+        self._names[workflow_id] = name_lower
+        self._by_exact_name.setdefault(name, set()).add(workflow_id)
+        if self._postings is not None:
+            self._index_trigrams(workflow_id, name_lower)
+
+    def _index_trigrams(self, workflow_id: str, name_lower: str):
+        postings = self._postings
+        for trigram in _trigrams(name_lower):
+            postings[trigram].add(workflow_id)
+
+    def _remove(self, workflow_id: str):
+        name = self._workflows[workflow_id].name
+        ids = self._by_exact_name.get(name)
+        if ids is not None:
+            ids.discard(workflow_id)
+            if not ids:
+                del self._by_exact_name[name]
+        name_lower = self._names.pop(workflow_id)
+        if self._postings is None:
+            return
+        for trigram in _trigrams(name_lower):
+            ids = self._postings.get(trigram)
+            if ids is not None:
+                ids.discard(workflow_id)
+                if not ids:
+                    del self._postings[trigram]
+
+    def refresh(self, workflows: Iterable[WorkflowInfo], version: Optional[int] = None):
+        """Sincroniza o índice com uma listagem completa"""
+        with self._lock:
+            current = {wf.id: wf for wf in workflows}
+
+            for workflow_id in [wid for wid in self._workflows if wid not in current]:
+                self._remove(workflow_id)
+                del self._workflows[workflow_id]
+
+            for workflow_id, wf in current.items():
+                old = self._workflows.get(workflow_id)
+                if old is None or old.name != wf.name:
+                    if old is not None:
+                        self._remove(workflow_id)
+                    self._add(workflow_id, wf.name)
+                self._workflows[workflow_id] = wf
+
+            self.version = version
+
+    def find_exact(self, name: str) -> List[WorkflowInfo]:
+        """Workflows com nome exatamente igual"""
+        with self._lock:
+            return [self._workflows[wid] for wid in sorted(self._by_exact_name.get(name, ()))]
+
+    def _ensure_postings(self):
+        if self._postings is None:
+            self._postings = defaultdict(set)
+            for workflow_id, name_lower in self._names.items():
+                self._index_trigrams(workflow_id, name_lower)
+
+    def _substring_matches(self, query: str) -> List[str]:
+        self._searches += 1
+        if len(query) < 3 or (self._postings is None and self._searches == 1):
+            # Buscas curtas não têm trigrama próprio; primeira busca dispensa o índice
+            return [wid for wid, name_lower in self._names.items() if query in name_lower]
+
+        self._ensure_postings()
+
+        # Todo trigrama da busca precisa estar no nome; intersectar só os mais
+        # seletivos e confirmar a substring nos candidatos restantes
+        postings = sorted((self._postings.get(query[i:i + 3], ()) for i in range(len(query) - 2)), key=len)
+        candidates = set(postings[0])
+        for ids in postings[1:4]:
+            if len(candidates) < 32:
+                break
+            candidates &= ids
+        return [wid for wid in candidates if query in self._names[wid]]
+
+    def _rank(self, workflow_id: str, query: str) -> tuple:
+        name_lower = self._names[workflow_id]
+        position = name_lower.find(query)
+        if name_lower == query:
+            kind = 0
+        elif position == 0:
+            kind = 1
+        elif not name_lower[position - 1].isalnum():
+            kind = 2  # início de palavra
+        else:
+            kind = 3
+        return kind, len(name_lower), name_lower, workflow_id
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[WorkflowInfo]:
+        """
+        Workflows cujo nome contém query (sem diferenciar maiúsculas), ordenados:
+        nome igual, prefixo, início de palavra, demais; depois nomes mais curtos
+        """
+        query = query.lower()
+        if not query:
+            return []
+
+        with self._lock:
+            matches = self._substring_matches(query)
+            rank = lambda wid: self._rank(wid, query)
+            if limit is not None and limit < len(matches):
+                matches = heapq.nsmallest(limit, matches, key=rank)
+            else:
+                matches.sort(key=rank)
+            return [self._workflows[wid] for wid in matches]
+
+    def search_similar(self, query: str, limit: int = 10) -> List[WorkflowInfo]:
+        """Busca tolerante a erros de digitação: ranking por trigramas em comum"""
+        query = query.lower().strip()
+        if not query:
+            return []
+
+        query_trigrams = _trigrams(query)
+        with self._lock:
+            self._ensure_postings()
+            shared = Counter()
+            for trigram in query_trigrams:
+                shared.update(self._postings.get(trigram, ()))
+
+            min_shared = max(1, MIN_TYPO_SIMILARITY * len(query_trigrams))
+            scored = [
+                (-count, len(self._names[wid]), self._names[wid], wid)
+                for wid, count in shared.items() if count >= min_shared
+            ]
+            scored.sort()
+            return [self._workflows[wid] for *_, wid in scored[:limit]]
@@ -0,0 +1,166 @@
+"""
+N8N-DevHub - Rate Limiter
+Limitador adaptativo de requisições (token bucket + concorrência AIMD)
+"""
+
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+
+# Status que indicam sobrecarga do servidor
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Converte header Retry-After (segundos ou data HTTP) em segundos"""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket com janela de concorrência adaptativa.
+    Em 429/503 reduz taxa e concorrência pela metade e respeita Retry-After;
+    com respostas saudáveis volta a crescer aditivamente até os limites.
+    """
+
+    def __init__(self, max_rate: float = None, max_concurrency: int = None,
+                 min_rate: float = 1.0, max_backoff: float = 30.0):
+        if max_rate is None:
+            try:
+                max_rate = float(os.getenv('N8N_RATE_LIMIT', 50))
+            except ValueError:
+                max_rate = 50.0
+        if max_concurrency is None:
+            try:
+                max_concurrency = int(os.getenv('N8N_MAX_CONCURRENCY', 16))
+            except ValueError:
+                max_concurrency = 16
+
+        # max_rate <= 0 desativa o token bucket (apenas AIMD + Retry-After)
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate) if max_rate > 0 else min_rate
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_backoff = max_backoff
+
+        self.rate = self.max_rate
+        self.window = float(self.max_concurrency)
+        self.in_flight = 0
+
+        self._cond = threading.Condition()
+        self._tokens = max(1.0, self.max_rate)
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._consecutive_throttles = 0
+
+        self.throttled_total = 0
+
+    def _refill(self, now: float):
+        if self.max_rate <= 0:
+            return
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._tokens = min(max(1.0, self.rate), self._tokens + elapsed * self.rate)
+
+    def try_acquire(self) -> float:
+        """
+        Tenta reservar uma vaga sem bloquear
+        Returns: 0.0 se adquiriu, senão segundos sugeridos de espera
+        """
+        with self._cond:
+            now = time.monotonic()
+
+            if now < self._blocked_until:
+                return self._blocked_until - now
+
+            if self.in_flight >= int(self.window):
+                return 0.05
+
+            self._refill(now)
+            if self.max_rate > 0 and self._tokens < 1.0:
+                return (1.0 - self._tokens) / self.rate
+
+            if self.max_rate > 0:
+                self._tokens -= 1.0
+            self.in_flight += 1
+            return 0.0
+
+    def acquire(self):
+        """Bloqueia até haver vaga e token disponíveis"""
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            with self._cond:
+                self._cond.wait(wait)
+
+    async def acquire_async(self):
+        """Versão asyncio de acquire()"""
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def release(self, status: Optional[int] = None, retry_after: Optional[float] = None):
+        """Libera a vaga e ajusta taxa/concorrência conforme a resposta"""
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            now = time.monotonic()
+
+            if status in THROTTLE_STATUS_CODES:
+                self.throttled_total += 1
+                self._consecutive_throttles += 1
+
+                # Pausa global: Retry-After do servidor ou backoff exponencial
+                if retry_after is None:
+                    retry_after = min(self.max_backoff, 0.5 * (2 ** (self._consecutive_throttles - 1)))
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+                # Redução multiplicativa (no máximo uma vez por segundo)
+                if now - self._last_decrease >= 1.0:
+                    self._last_decrease = now
+                    self.window = max(1.0, self.window / 2)
+                    if self.max_rate > 0:
+                        self.rate = max(self.min_rate, self.rate / 2)
+                        self._tokens = min(self._tokens, 1.0)
+
+            elif status is not None and status < 500:
+                # Aumento aditivo
+                self._consecutive_throttles = 0
+                self.window = min(float(self.max_concurrency), self.window + 1.0 / self.window)
+                if self.max_rate > 0:
+                    self.rate = min(self.max_rate, self.rate + 1.0)
+
+            self._cond.notify_all()
+
+    def get_stats(self) -> Dict:
+        """Retorna estado atual do limitador"""
+        with self._cond:
+            return {
+                'rate': self.rate if self.max_rate > 0 else None,
+                'max_rate': self.max_rate if self.max_rate > 0 else None,
+                'concurrency': int(self.window),
+                'max_concurrency': self.max_concurrency,
+                'in_flight': self.in_flight,
+                'throttled_total': self.throttled_total
+            }
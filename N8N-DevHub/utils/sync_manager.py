@@ -4,19 +4,66 @@ Sistema de sincronização assíncrona em tempo real
 """
 
 import asyncio
+import itertools
 import time
-import json
 import os
-import hashlib
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Callable
+from typing import Dict, List, Optional, Set, Callable, Tuple
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 import threading
 import queue
+import sqlite3
 
 from models.workflow_model import WorkflowModel
 from controllers.workflow_controller import WorkflowController
+from utils.workflow_hash import (HASH_VERSION, WorkflowFingerprint, calculate_workflow_fingerprint,
+                                 diff_fingerprints)
+from utils.sync_state_store import decode_fingerprint, encode_fingerprint
+from utils.debounce import DebounceScheduler
+from utils.write_intents import WriteIntentRegistry
+
+
+# Tipos de evento (a parada entra na fila como os demais: o acúmulo é atendido antes)
+EVENT_STOP = 0
+EVENT_LOCAL = 1
+EVENT_REMOTE = 2
+EVENT_UPLOAD = 3
+
+# Latências guardadas para as estatísticas (últimos eventos)
+LATENCY_SAMPLES = 1000
+
+
+class SyncMetrics:
+    """Latência de propagação (detecção da mudança -> fim do processamento)"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.events_processed = 0
+    
+    def record(self, latency: float):
+        with self._lock:
+            self._latencies.append(latency)
+            self.events_processed += 1
+    
+    def snapshot(self) -> Dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            last = self._latencies[-1] if self._latencies else None
+            processed = self.events_processed
+        
+        if not latencies:
+            return {'events_processed': processed, 'last': None, 'avg': None, 'p95': None, 'max': None}
+        return {
+            'events_processed': processed,
+            'last': last,
+            'avg': sum(latencies) / len(latencies),
+            'p95': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+            'max': latencies[-1]
+        }
 
 
 class SyncState:
@@ -26,40 +73,126 @@ class SyncState:
         self.name = name
         self.local_hash: Optional[str] = None
         self.remote_hash: Optional[str] = None
+        self.local_fingerprint: Optional[WorkflowFingerprint] = None
+        self.remote_fingerprint: Optional[WorkflowFingerprint] = None
+        self.last_changes: Optional[Dict] = None  # Nós alterados na última mudança detectada
         self.local_updated: Optional[datetime] = None
         self.remote_updated: Optional[datetime] = None
-        self.syncing = False
+        self.base_hash: Optional[str] = None  # Último conteúdo igual nos dois lados
         self.conflict = False
         self.last_sync: Optional[datetime] = None
+        
+        # Protege o estado entre o worker do workflow e o monitor remoto
+        self.lock = threading.RLock()
+        self._active_syncs = 0
+    
+    @property
+    def syncing(self) -> bool:
+        """Há um envio/download deste workflow em andamento"""
+        return self._active_syncs > 0
+    
+    @contextmanager
+    def busy(self):
+        """Bloco de sincronização (com o lock do estado)"""
+        with self.lock:
+            self._active_syncs += 1
+            try:
+                yield
+            finally:
+                self._active_syncs -= 1
+    
+    def to_record(self) -> Dict:
+        """Registro para o SyncStateStore"""
+        return {
+            'workflow_id': self.workflow_id,
+            'name': self.name,
+            'local_hash': self.local_hash,
+            'remote_hash': self.remote_hash,
+            'base_hash': self.base_hash,
+            'local_updated': _format_datetime(self.local_updated),
+            'remote_updated': _format_datetime(self.remote_updated),
+            'last_sync': _format_datetime(self.last_sync),
+            'local_fingerprint': encode_fingerprint(self.local_fingerprint),
+            'remote_fingerprint': encode_fingerprint(self.remote_fingerprint),
+            'hash_version': HASH_VERSION
+        }
+    
+    @classmethod
+    def from_record(cls, record: Dict) -> 'SyncState':
+        state = cls(record['workflow_id'], record['name'])
+        state.local_hash = record['local_hash']
+        state.remote_hash = record['remote_hash']
+        state.base_hash = record['base_hash']
+        state.local_updated = _parse_iso(record['local_updated'])
+        state.remote_updated = _parse_iso(record['remote_updated'])
+        state.last_sync = _parse_iso(record['last_sync'])
+        state.local_fingerprint = decode_fingerprint(record['local_fingerprint'])
+        state.remote_fingerprint = decode_fingerprint(record['remote_fingerprint'])
+        return state
+
+
+def _format_datetime(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _parse_iso(value: Optional[str]) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def _is_workflow_file(path: str) -> bool:
+    """Arquivos *.json visíveis (temporários de editores e do DevHub começam com '.')"""
+    return path.endswith('.json') and not os.path.basename(path).startswith('.')
 
 
 class WorkflowFileHandler(FileSystemEventHandler):
-    """Handler para monitorar mudanças nos arquivos de workflow"""
+    """
+    Handler para monitorar mudanças nos arquivos de workflow
+    Eventos passam por um único agendador: vários eventos do mesmo arquivo dentro
+    da janela viram um só, e rajadas (git checkout, salvar tudo) saem num lote
+    """
     
-    def __init__(self, sync_manager):
+    def __init__(self, sync_manager, window: float = None):
         self.sync_manager = sync_manager
-        self.processing = set()  # Evitar loops de processamento
+        if window is None:
+            try:
+                window = float(os.getenv('N8N_SYNC_DEBOUNCE', 1.0))
+            except ValueError:
+                window = 1.0
+        self.scheduler = DebounceScheduler(window, sync_manager.handle_file_events,
+                                           name='devhub-file-debounce')
+    
+    def on_created(self, event):
+        if not event.is_directory and _is_workflow_file(event.src_path):
+            self.scheduler.touch(event.src_path, 'changed')
     
     def on_modified(self, event):
-        if event.is_directory or not event.src_path.endswith('.json'):
-            return
-        
-        filename = os.path.basename(event.src_path)
-        
-        # Evitar processar o mesmo arquivo múltiplas vezes rapidamente
-        if filename in self.processing:
+        if not event.is_directory and _is_workflow_file(event.src_path):
+            self.scheduler.touch(event.src_path, 'changed')
+    
+    def on_deleted(self, event):
+        if not event.is_directory and _is_workflow_file(event.src_path):
+            self.scheduler.touch(event.src_path, 'deleted')
+    
+    def on_moved(self, event):
+        # Salvamento atômico dos editores: temporário renomeado por cima do arquivo
+        if event.is_directory:
             return
-            
-        self.processing.add(filename)
-        
-        # Delay para evitar múltiplas notificações
-        threading.Timer(1.0, self._process_file_change, args=[event.src_path, filename]).start()
+        if _is_workflow_file(event.src_path):
+            self.scheduler.touch(event.src_path, 'deleted')
+        if _is_workflow_file(event.dest_path):
+            self.scheduler.touch(event.dest_path, 'moved')
     
-    def _process_file_change(self, filepath: str, filename: str):
-        try:
-            self.sync_manager.queue_local_change(filepath, filename)
-        finally:
-            self.processing.discard(filename)
+    def flush(self):
+        """Entrega na hora os eventos que ainda aguardam a janela"""
+        batch = self.scheduler.drain()
+        if batch:
+            self.sync_manager.handle_file_events(batch)
+    
+    def stop(self):
+        self.scheduler.stop()
 
 
 class AsyncSyncManager:
@@ -85,9 +218,34 @@ class AsyncSyncManager:
         self.on_conflict: Optional[Callable] = None
         self.on_error: Optional[Callable] = None
         
-        # Filas para eventos
-        self.local_changes = queue.Queue()
-        self.remote_changes = queue.Queue()
+        # Workers de sync: eventos do mesmo workflow vão sempre para a mesma fila
+        # (ordem garantida); workflows diferentes sincronizam em paralelo
+        try:
+            self.sync_workers = max(1, int(os.getenv('N8N_SYNC_WORKERS', 4)))
+        except ValueError:
+            self.sync_workers = 4
+        self.shards = [queue.PriorityQueue() for _ in range(self.sync_workers)]
+        self._event_order = itertools.count()
+        self.metrics = SyncMetrics()
+        
+        # Edições seguidas do mesmo workflow viram um único envio: enviado após
+        # N8N_SYNC_COALESCE segundos sem edições, ou N8N_SYNC_MAX_DELAY desde a primeira
+        try:
+            coalesce_window = float(os.getenv('N8N_SYNC_COALESCE', 2.0))
+        except ValueError:
+            coalesce_window = 2.0
+        try:
+            max_delay = float(os.getenv('N8N_SYNC_MAX_DELAY', 10.0))
+        except ValueError:
+            max_delay = 10.0
+        self.upload_scheduler = DebounceScheduler(coalesce_window, self._queue_uploads, max_delay=max_delay,
+                                                  batch_grace=0, name='devhub-upload-coalesce')
+        
+        # Conflitos são resolvidos um de cada vez numa thread própria (on_conflict pode
+        # perguntar no terminal); o worker do workflow não fica parado esperando a escolha
+        self.conflict_queue: queue.Queue = queue.Queue()
+        self._pending_conflicts: Dict[str, Optional[Dict]] = {}  # ID -> dados remotos mais recentes
+        self._conflicts_lock = threading.Lock()
         
         # File watcher
         self.observer = Observer()
@@ -95,7 +253,9 @@ class AsyncSyncManager:
         
         # Threads
         self.remote_monitor_thread = None
-        self.sync_processor_thread = None
+        self.conflict_thread = None
+        self._store_closed = False
+        self.sync_worker_threads: List[threading.Thread] = []
     
     def add_workflow(self, identifier: str, by_id: bool = False):
         """Adiciona workflow para monitoramento"""
@@ -114,6 +274,7 @@ class AsyncSyncManager:
             self.target_workflows.discard(identifier)
             if identifier in self.sync_states:
                 del self.sync_states[identifier]
+                self.model.sync_state_store.delete(identifier)
         else:
             self.target_names.discard(identifier)
     
@@ -123,6 +284,10 @@ class AsyncSyncManager:
             return False
         
         self.running = True
+        self._store_closed = False
+        
+        # Gravações do próprio sync não voltam como mudanças locais
+        self.model.write_intents = WriteIntentRegistry()
         
         # Inicializar estado dos workflows
         self._initialize_sync_states()
@@ -142,11 +307,17 @@ class AsyncSyncManager:
         )
         self.remote_monitor_thread.start()
         
-        self.sync_processor_thread = threading.Thread(
-            target=self._sync_processor_loop,
-            daemon=True
-        )
-        self.sync_processor_thread.start()
+        self.sync_worker_threads = [
+            threading.Thread(target=self._sync_worker_loop, args=(shard,),
+                             name=f'devhub-sync-{index}', daemon=True)
+            for index, shard in enumerate(self.shards)
+        ]
+        for thread in self.sync_worker_threads:
+            thread.start()
+        
+        self.conflict_thread = threading.Thread(target=self._conflict_loop,
+                                                name='devhub-sync-conflicts', daemon=True)
+        self.conflict_thread.start()
         
         if self.on_sync_start:
             self.on_sync_start()
@@ -161,11 +332,50 @@ class AsyncSyncManager:
             self.observer.stop()
             self.observer.join()
         
+        # Eventos de arquivo ainda na janela de debounce vão para as filas
+        self.file_handler.flush()
+        self.file_handler.stop()
+        
+        # Parada no fim de cada fila: workers terminam o acúmulo antes de sair
+        for shard, thread in zip(self.shards, self.sync_worker_threads):
+            if thread.is_alive():
+                shard.put((1, next(self._event_order), EVENT_STOP, None, time.monotonic()))
+        for thread in self.sync_worker_threads:
+            thread.join()
+        
+        # Edições aguardando o agrupamento são enviadas antes de parar, junto com
+        # envios que o agendador tenha enfileirado depois da saída dos workers
+        pending = self.upload_scheduler.drain()
+        self.upload_scheduler.stop()
+        for shard in self.shards:
+            while True:
+                try:
+                    _, _, kind, payload, detected_at = shard.get_nowait()
+                except queue.Empty:
+                    break
+                if kind != EVENT_STOP:
+                    self._handle_event(kind, payload, detected_at)
+        for workflow_id, _, first_seen in pending:
+            self._handle_event(EVENT_UPLOAD, workflow_id, first_seen)
+        
+        # Não espera a thread de conflitos: ela pode estar parada numa pergunta ao usuário
+        self.conflict_queue.put(None)
+        
+        self.model.write_intents = None
+        
+        self._persist(*self.sync_states.values())
+        self._store_closed = True
+        self.model.sync_state_store.close()
+        
         if self.on_sync_complete:
             self.on_sync_complete()
     
     def _initialize_sync_states(self):
-        """Inicializa estados de sincronização"""
+        """
+        Inicializa estados de sincronização
+        Estados salvos de uma sessão anterior são retomados: workflows com o mesmo
+        updatedAt remoto não são baixados de novo
+        """
         try:
             # Workflows remotos
             remote_workflows = self.controller.list_remote_workflows()
@@ -173,35 +383,54 @@ class AsyncSyncManager:
             # Workflows locais
             local_workflows = self.controller.list_local_workflows()
             
+            saved_states = self.model.sync_state_store.load()
+            
             # Filtrar apenas os workflows alvo
             for wf in remote_workflows:
                 if wf.id in self.target_workflows or wf.name in self.target_names:
-                    state = SyncState(wf.id, wf.name)
-                    state.remote_updated = self._parse_datetime(wf.updated_at)
+                    remote_updated = self._parse_datetime(wf.updated_at)
+                    record = saved_states.get(wf.id)
                     
-                    # Calcular hash remoto
-                    remote_data = self.model.get_workflow_by_id(wf.id)
-                    if remote_data:
-                        state.remote_hash = self._calculate_workflow_hash(remote_data)
+                    if record and record['remote_hash'] and _parse_iso(record['remote_updated']) == remote_updated:
+                        state = SyncState.from_record(record)
+                        state.name = wf.name
+                    else:
+                        state = SyncState(wf.id, wf.name)
+                        if record:
+                            state.base_hash = record['base_hash']
+                            state.last_sync = _parse_iso(record['last_sync'])
+                        
+                        # Calcular hash remoto
+                        remote_data = self.model.get_workflow_by_id(wf.id)
+                        if remote_data:
+                            state.remote_fingerprint = calculate_workflow_fingerprint(remote_data)
+                            state.remote_hash = state.remote_fingerprint.root
                     
+                    state.remote_updated = remote_updated
                     self.sync_states[wf.id] = state
             
             # Verificar workflows locais
             for local_wf in local_workflows:
-                wf_id = local_wf.get('id')
+                wf_id = local_wf.id
                 if wf_id and wf_id in self.sync_states:
                     state = self.sync_states[wf_id]
                     
-                    # Calcular hash local
-                    state.local_hash = self._calculate_workflow_hash(local_wf['data'])
+                    # Hash local (do manifesto, sem reler arquivos inalterados)
+                    if state.local_hash != local_wf.hash:
+                        state.local_fingerprint = None
+                    state.local_hash = local_wf.hash
+                    if state.base_hash is None and state.local_hash == state.remote_hash:
+                        state.base_hash = state.local_hash
                     
                     # Timestamp local
                     try:
-                        stat = os.stat(local_wf['filepath'])
+                        stat = os.stat(local_wf.filepath)
                         state.local_updated = datetime.fromtimestamp(stat.st_mtime)
                     except:
                         pass
             
+            self._persist(*self.sync_states.values())
+            
         except Exception as e:
             if self.on_error:
                 self.on_error(f"Erro ao inicializar estados: {e}")
@@ -217,67 +446,107 @@ class AsyncSyncManager:
                     self.on_error(f"Erro no monitor remoto: {e}")
                 time.sleep(self.poll_interval)
     
-    def _sync_processor_loop(self):
-        """Loop de processamento de sincronização"""
-        while self.running:
-            try:
-                # Processar mudanças locais
-                try:
-                    filepath, filename = self.local_changes.get_nowait()
-                    self._process_local_change(filepath, filename)
-                except queue.Empty:
-                    pass
-                
-                # Processar mudanças remotas
-                try:
-                    workflow_id = self.remote_changes.get_nowait()
-                    self._process_remote_change(workflow_id)
-                except queue.Empty:
-                    pass
-                
-                time.sleep(0.5)  # Pequeno delay
-                
-            except Exception as e:
-                if self.on_error:
-                    self.on_error(f"Erro no processador de sync: {e}")
+    def _put_event(self, kind: int, shard_key: str, payload=None, detected_at: float = None):
+        """Enfileira na fila do workflow (shard_key: ID, ou nome do arquivo sem ID)"""
+        shard = self.shards[hash(shard_key) % len(self.shards)]
+        # Mesma prioridade para todos os eventos, inclusive a parada: ordem de chegada
+        shard.put((1, next(self._event_order), kind, payload, detected_at or time.monotonic()))
+    
+    def _sync_worker_loop(self, shard: queue.PriorityQueue):
+        """
+        Loop de um worker de sincronização
+        Bloqueia na sua fila e atende o acúmulo sem espera, na ordem de chegada
+        """
+        while True:
+            _, _, kind, payload, detected_at = shard.get()
+            if kind == EVENT_STOP:
+                break
+            self._handle_event(kind, payload, detected_at)
+    
+    def _handle_event(self, kind: int, payload, detected_at: float):
+        try:
+            if kind == EVENT_LOCAL:
+                self._process_local_change(*payload, detected_at=detected_at)
+            elif kind == EVENT_UPLOAD:
+                self._process_pending_upload(payload)
+            else:
+                self._process_remote_change(payload)
+        except Exception as e:
+            if self.on_error:
+                self.on_error(f"Erro no processador de sync: {e}")
+        finally:
+            self.metrics.record(time.monotonic() - detected_at)
     
     def _check_remote_changes(self):
         """Verifica mudanças remotas"""
         try:
-            remote_workflows = self.controller.list_remote_workflows()
+            # Uma listagem nova por ciclo (buscas seguintes no ciclo usam o cache)
+            detected_at = time.monotonic()
+            remote_workflows = self.controller.list_remote_workflows(refresh=True)
             
             for wf in remote_workflows:
-                if wf.id not in self.sync_states:
-                    continue
-                
-                state = self.sync_states[wf.id]
-                if state.syncing:
+                if not self.running:
+                    break
+                state = self.sync_states.get(wf.id)
+                if state is None or state.syncing:
                     continue
                 
                 # Verificar se houve mudança
                 remote_updated = self._parse_datetime(wf.updated_at)
-                if state.remote_updated != remote_updated:
-                    # Buscar dados completos
-                    remote_data = self.model.get_workflow_by_id(wf.id)
-                    if remote_data:
-                        new_hash = self._calculate_workflow_hash(remote_data)
+                if state.remote_updated == remote_updated:
+                    continue
+                
+                # Buscar dados completos
+                remote_data = self.model.get_workflow_by_id(wf.id)
+                if not remote_data:
+                    continue
+                fingerprint = calculate_workflow_fingerprint(remote_data)
+                
+                # Workflow ocupado no worker: verificado de novo no próximo ciclo
+                if not state.lock.acquire(blocking=False):
+                    continue
+                try:
+                    # updatedAt novo sem mudança de conteúdo não é buscado de novo
+                    state.remote_updated = remote_updated
+                    
+                    if fingerprint.root != state.remote_hash:
+                        state.last_changes = self._diff(state.remote_fingerprint, fingerprint)
+                        state.remote_fingerprint = fingerprint
+                        state.remote_hash = fingerprint.root
                         
-                        if new_hash != state.remote_hash:
-                            state.remote_hash = new_hash
-                            state.remote_updated = remote_updated
-                            
-                            # Enfileirar mudança remota
-                            self.remote_changes.put(wf.id)
+                        # Enfileirar mudança remota
+                        self._put_event(EVENT_REMOTE, wf.id, wf.id, detected_at)
+                    
+                    self._persist(state)
+                finally:
+                    state.lock.release()
                             
         except Exception as e:
             if self.on_error:
                 self.on_error(f"Erro ao verificar mudanças remotas: {e}")
     
-    def queue_local_change(self, filepath: str, filename: str):
+    def handle_file_events(self, batch: List[Tuple[str, str, float]]):
+        """Lote do agendador de arquivos: [(caminho, changed|moved|deleted, primeiro evento)]"""
+        local_index = self.model.local_index
+        write_intents = self.model.write_intents
+        for filepath, kind, detected_at in batch:
+            # Eco de uma gravação do próprio sync: descartado sem ler o arquivo
+            if kind != 'deleted' and write_intents is not None and write_intents.is_echo(filepath):
+                continue
+            if kind == 'deleted':
+                # Manter o índice ID -> arquivo em dia
+                local_index.remove(filepath)
+                continue
+            if kind == 'moved':
+                local_index.update(filepath)
+            self.queue_local_change(filepath, os.path.basename(filepath), detected_at)
+    
+    def queue_local_change(self, filepath: str, filename: str, detected_at: float = None):
         """Enfileira mudança local"""
-        self.local_changes.put((filepath, filename))
+        shard_key = self.model.extract_id_from_filename(filename) or filename
+        self._put_event(EVENT_LOCAL, shard_key, (filepath, filename), detected_at)
     
-    def _process_local_change(self, filepath: str, filename: str):
+    def _process_local_change(self, filepath: str, filename: str, detected_at: float = None):
         """Processa mudança local"""
         try:
             # Extrair ID do arquivo
@@ -287,37 +556,68 @@ class AsyncSyncManager:
                 return
             
             state = self.sync_states[workflow_id]
-            if state.syncing:
-                return
             
             # Carregar dados locais
             local_data = self.model.load_workflow_from_file(filename)
             if not local_data:
                 return
+            self.model.local_index.update(filepath, local_data)
             
-            new_hash = self._calculate_workflow_hash(local_data)
-            
-            # Verificar se realmente mudou
-            if new_hash == state.local_hash:
-                return
-            
-            state.local_hash = new_hash
-            state.local_updated = datetime.now()
+            fingerprint = calculate_workflow_fingerprint(local_data)
             
-            # Verificar conflito
-            if self._has_conflict(state):
-                state.conflict = True
-                if self.on_conflict:
-                    resolution = self.on_conflict(state)
-                    self._resolve_conflict(state, resolution)
-            else:
-                # Sync para remoto
-                self._sync_to_remote(state, local_data)
+            with state.lock:
+                # Verificar se realmente mudou
+                if fingerprint.root == state.local_hash:
+                    return
+                
+                state.last_changes = self._diff(state.local_fingerprint, fingerprint)
+                state.local_fingerprint = fingerprint
+                state.local_hash = fingerprint.root
+                state.local_updated = datetime.now()
+                self._persist(state)
+                
+                # Verificar conflito
+                if self._has_conflict(state):
+                    self._report_conflict(state)
+                else:
+                    # Sync para remoto (edições seguidas são agrupadas num único envio)
+                    self._schedule_upload(state, local_data, detected_at)
                 
         except Exception as e:
             if self.on_error:
                 self.on_error(f"Erro ao processar mudança local: {e}")
     
+    def _schedule_upload(self, state: SyncState, local_data: Dict, detected_at: float = None):
+        # Ao parar, o acúmulo das filas é enviado sem esperar o agrupamento
+        if self.upload_scheduler.window > 0 and self.running:
+            self.upload_scheduler.touch(state.workflow_id, at=detected_at)
+        else:
+            self._sync_to_remote(state, local_data)
+    
+    def _queue_uploads(self, batch: List[Tuple[str, None, float]]):
+        """Workflows cujas edições assentaram: envio na fila do próprio workflow"""
+        for workflow_id, _, first_seen in batch:
+            self._put_event(EVENT_UPLOAD, workflow_id, workflow_id, first_seen)
+    
+    def _process_pending_upload(self, workflow_id: str):
+        """Envia a versão local mais recente após uma sequência de edições"""
+        state = self.sync_states.get(workflow_id)
+        if state is None:
+            return
+        
+        with state.lock:
+            # Edição desfeita, versão remota já igual, ou conflito surgido enquanto aguardava
+            # (tratado pela mudança remota)
+            if state.local_hash == state.remote_hash:
+                return
+            if state.base_hash is not None and self._has_conflict(state):
+                return
+            
+            # Resumo de todas as edições agrupadas
+            if state.remote_fingerprint and state.local_fingerprint:
+                state.last_changes = self._diff(state.remote_fingerprint, state.local_fingerprint)
+            self._sync_to_remote(state, None)
+    
     def _process_remote_change(self, workflow_id: str):
         """Processa mudança remota"""
         try:
@@ -325,23 +625,19 @@ class AsyncSyncManager:
                 return
                 
             state = self.sync_states[workflow_id]
-            if state.syncing:
-                return
             
             # Buscar dados remotos
             remote_data = self.model.get_workflow_by_id(workflow_id)
             if not remote_data:
                 return
             
-            # Verificar conflito
-            if self._has_conflict(state):
-                state.conflict = True
-                if self.on_conflict:
-                    resolution = self.on_conflict(state)
-                    self._resolve_conflict(state, resolution, remote_data)
-            else:
-                # Sync para local
-                self._sync_to_local(state, remote_data)
+            with state.lock:
+                # Verificar conflito
+                if self._has_conflict(state):
+                    self._report_conflict(state, remote_data)
+                else:
+                    # Sync para local
+                    self._sync_to_local(state, remote_data)
                 
         except Exception as e:
             if self.on_error:
@@ -349,51 +645,105 @@ class AsyncSyncManager:
     
     def _sync_to_remote(self, state: SyncState, local_data: Dict):
         """Sincroniza para remoto"""
-        state.syncing = True
-        try:
-            success, message = self.controller.upload_workflow(
-                state.workflow_id, by_filename=False
-            )
+        with state.busy():
+            try:
+                success, message = self.controller.upload_workflow(
+                    state.workflow_id, by_filename=False
+                )
+                
+                if success:
+                    state.remote_hash = state.base_hash = state.local_hash
+                    state.remote_fingerprint = state.local_fingerprint
+                    state.last_sync = datetime.now()
+                    state.conflict = False
+                    self._persist(state)
+                    print(f"🔄 Sincronizado para remoto: {state.name}{self._describe_changes(state.last_changes)}")
+                else:
+                    if self.on_error:
+                        self.on_error(f"Erro ao sincronizar '{state.name}': {message}")
             
-            if success:
-                state.last_sync = datetime.now()
-                state.conflict = False
-                print(f"🔄 Sincronizado para remoto: {state.name}")
-            else:
+            except Exception as e:
                 if self.on_error:
-                    self.on_error(f"Erro ao sincronizar '{state.name}': {message}")
-                    
-        except Exception as e:
-            if self.on_error:
-                self.on_error(f"Erro ao sincronizar para remoto: {e}")
-        finally:
-            state.syncing = False
+                    self.on_error(f"Erro ao sincronizar para remoto: {e}")
     
     def _sync_to_local(self, state: SyncState, remote_data: Dict):
         """Sincroniza para local"""
-        state.syncing = True
-        try:
-            filepath = self.model.save_workflow_to_file(remote_data)
-            state.local_hash = state.remote_hash
-            state.last_sync = datetime.now()
-            state.conflict = False
-            
-            print(f"🔄 Sincronizado para local: {state.name}")
+        with state.busy():
+            try:
+                filepath = self.model.save_workflow_to_file(remote_data)
+                self.model.remote_fingerprints.record(remote_data)
+                self.model.save_state()
+                state.local_hash = state.base_hash = state.remote_hash
+                state.local_fingerprint = state.remote_fingerprint
+                state.last_sync = datetime.now()
+                state.conflict = False
+                self._persist(state)
+                
+                print(f"🔄 Sincronizado para local: {state.name}{self._describe_changes(state.last_changes)}")
             
-        except Exception as e:
-            if self.on_error:
-                self.on_error(f"Erro ao sincronizar para local: {e}")
-        finally:
-            state.syncing = False
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(f"Erro ao sincronizar para local: {e}")
     
     def _has_conflict(self, state: SyncState) -> bool:
-        """Verifica se há conflito"""
+        """
+        Verifica se há conflito
+        Com a versão base conhecida: os dois lados mudaram desde o último sync
+        """
+        if state.base_hash is not None:
+            return (state.local_hash != state.base_hash and
+                    state.remote_hash != state.base_hash and
+                    state.local_hash != state.remote_hash)
+        
         return (state.local_hash is not None and 
                 state.remote_hash is not None and
                 state.local_hash != state.remote_hash and
                 state.local_updated is not None and
                 state.remote_updated is not None)
     
+    def _report_conflict(self, state: SyncState, remote_data: Dict = None):
+        """Marca o conflito e o envia à thread de resolução (uma vez por workflow)"""
+        state.conflict = True
+        if not self.on_conflict:
+            return
+        
+        with self._conflicts_lock:
+            pending = state.workflow_id in self._pending_conflicts
+            if remote_data is not None or not pending:
+                self._pending_conflicts[state.workflow_id] = remote_data
+        if not pending:
+            self.conflict_queue.put(state.workflow_id)
+    
+    def _conflict_loop(self):
+        """Resolve conflitos na ordem em que surgiram, um por vez"""
+        while True:
+            workflow_id = self.conflict_queue.get()
+            if workflow_id is None:
+                break
+            
+            try:
+                state = self.sync_states.get(workflow_id)
+                with self._conflicts_lock:
+                    remote_data = self._pending_conflicts.get(workflow_id)
+                
+                # Resolvido enquanto aguardava na fila (ex.: edição desfeita)
+                if state is None or not self._has_conflict(state):
+                    continue
+                
+                resolution = self.on_conflict(state)
+                with self._conflicts_lock:
+                    remote_data = self._pending_conflicts.pop(workflow_id, remote_data)
+                
+                with state.lock:
+                    if self._has_conflict(state):
+                        self._resolve_conflict(state, resolution, remote_data)
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(f"Erro ao resolver conflito: {e}")
+            finally:
+                with self._conflicts_lock:
+                    self._pending_conflicts.pop(workflow_id, None)
+    
     def _resolve_conflict(self, state: SyncState, resolution: str, remote_data: Dict = None):
         """Resolve conflito baseado na estratégia"""
         try:
@@ -430,17 +780,37 @@ class AsyncSyncManager:
             if self.on_error:
                 self.on_error(f"Erro ao resolver conflito: {e}")
     
+    def _persist(self, *states: SyncState):
+        """Grava estados no banco de sync (falha de escrita não interrompe o sync)"""
+        # Após o stop_sync o banco fica fechado (não é reaberto por uma thread atrasada)
+        if self._store_closed:
+            return
+        try:
+            self.model.sync_state_store.save_many(state.to_record() for state in states)
+        except sqlite3.Error as e:
+            if self.on_error:
+                self.on_error(f"Erro ao salvar estado de sincronização: {e}")
+    
     def _calculate_workflow_hash(self, workflow_data: Dict) -> str:
         """Calcula hash de um workflow para detectar mudanças"""
-        # Remover campos que mudam automaticamente
-        clean_data = {k: v for k, v in workflow_data.items() 
-                     if k not in ['updatedAt', 'createdAt', 'versionId', 'shared']}
-        
-        # Converter para JSON ordenado
-        json_str = json.dumps(clean_data, sort_keys=True, separators=(',', ':'))
-        
-        # Calcular SHA256
-        return hashlib.sha256(json_str.encode()).hexdigest()
+        return calculate_workflow_fingerprint(workflow_data).root
+    
+    def _diff(self, old: Optional[WorkflowFingerprint], new: WorkflowFingerprint) -> Optional[Dict]:
+        """Nós alterados entre dois fingerprints (None sem versão anterior)"""
+        return diff_fingerprints(old, new) if old is not None else None
+    
+    def _describe_changes(self, changes: Optional[Dict]) -> str:
+        """Resumo curto dos nós alterados para as mensagens de sync"""
+        if not changes:
+            return ""
+        parts = [f"+{name}" for name in changes['added']]
+        parts += [f"-{name}" for name in changes['removed']]
+        parts += [f"~{name}" for name in changes['modified']]
+        if changes['connections']:
+            parts.append("conexões")
+        if changes['settings']:
+            parts.append("settings")
+        return f" ({', '.join(parts)})" if parts else ""
     
     def _parse_datetime(self, date_str: str) -> Optional[datetime]:
         """Converte string de data para datetime"""
@@ -458,6 +828,10 @@ class AsyncSyncManager:
             'workflows_monitored': len(self.sync_states),
             'conflicts': len([s for s in self.sync_states.values() if s.conflict]),
             'syncing': len([s for s in self.sync_states.values() if s.syncing]),
+            'queue_depth': sum(shard.qsize() for shard in self.shards),
+            'workers': self.sync_workers,
+            'echoes_suppressed': self.model.write_intents.echoes_suppressed if self.model.write_intents else 0,
+            'latency': self.metrics.snapshot(),
             'states': {wf_id: {
                 'name': state.name,
                 'syncing': state.syncing,
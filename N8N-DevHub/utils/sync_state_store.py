@@ -0,0 +1,116 @@
+"""
+N8N-DevHub - Sync State Store
+Estado da sincronização persistido em SQLite (retomado a cada sync-start)
+"""
+
+import json
+import sqlite3
+import threading
+from dataclasses import asdict
+from typing import Dict, Iterable, Optional
+
+from utils.workflow_hash import HASH_VERSION, WorkflowFingerprint
+
+
+# Versão do esquema (bancos de outra versão são recriados)
+SCHEMA_VERSION = 1
+
+SYNC_STATE_FIELDS = ('workflow_id', 'name', 'local_hash', 'remote_hash', 'base_hash',
+                     'local_updated', 'remote_updated', 'last_sync',
+                     'local_fingerprint', 'remote_fingerprint', 'hash_version')
+
+
+def encode_fingerprint(fingerprint: Optional[WorkflowFingerprint]) -> Optional[str]:
+    return json.dumps(asdict(fingerprint), separators=(',', ':')) if fingerprint else None
+
+
+def decode_fingerprint(value: Optional[str]) -> Optional[WorkflowFingerprint]:
+    if not value:
+        return None
+    try:
+        return WorkflowFingerprint(**json.loads(value))
+    except (ValueError, TypeError):
+        return None
+
+
+class SyncStateStore:
+    """
+    Uma linha por workflow monitorado: hashes, datas (ISO 8601), último sync
+    e hash da versão base (último conteúdo igual nos dois lados)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            # Usado pelas threads do monitor, do processador e do watcher
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            if conn.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+                conn.execute('DROP TABLE IF EXISTS sync_states')
+                conn.execute(f'PRAGMA user_version={SCHEMA_VERSION}')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS sync_states (
+                    workflow_id TEXT PRIMARY KEY,
+                    name TEXT,
+                    local_hash TEXT,
+                    remote_hash TEXT,
+                    base_hash TEXT,
+                    local_updated TEXT,
+                    remote_updated TEXT,
+                    last_sync TEXT,
+                    local_fingerprint TEXT,
+                    remote_fingerprint TEXT,
+                    hash_version INTEGER
+                )
+            ''')
+            self._conn = conn
+        return self._conn
+
+    def load(self) -> Dict[str, Dict]:
+        """Estados salvos por ID (hashes de outra versão do algoritmo são descartados)"""
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute(f"SELECT {', '.join(SYNC_STATE_FIELDS)} FROM sync_states").fetchall()
+
+        records = {}
+        for row in rows:
+            record = dict(zip(SYNC_STATE_FIELDS, row))
+            if record['hash_version'] != HASH_VERSION:
+                for key in ('local_hash', 'remote_hash', 'base_hash', 'local_fingerprint', 'remote_fingerprint'):
+                    record[key] = None
+            records[record['workflow_id']] = record
+        return records
+
+    def save_many(self, records: Iterable[Dict]):
+        """Grava (insere ou substitui) estados numa única transação"""
+        rows = [tuple(record.get(key) for key in SYNC_STATE_FIELDS) for record in records]
+        if not rows:
+            return
+
+        placeholders = ', '.join('?' * len(SYNC_STATE_FIELDS))
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute('BEGIN')
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO sync_states ({', '.join(SYNC_STATE_FIELDS)}) VALUES ({placeholders})",
+                    rows
+                )
+
+    def save(self, record: Dict):
+        self.save_many([record])
+
+    def delete(self, workflow_id: str):
+        with self._lock:
+            self._connect().execute('DELETE FROM sync_states WHERE workflow_id = ?', (workflow_id,))
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
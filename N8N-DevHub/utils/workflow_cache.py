@@ -0,0 +1,88 @@
+"""
+N8N-DevHub - Workflow Cache
+Cache com TTL da listagem remota de workflows
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from models.workflow_model import WorkflowInfo
+
+
+class RemoteWorkflowCache:
+    """Cache compartilhado da listagem remota (com TTL e invalidação explícita)"""
+
+    def __init__(self, ttl: float = None):
+        if ttl is None:
+            try:
+                ttl = float(os.getenv('N8N_LIST_CACHE_TTL', 30))
+            except ValueError:
+                ttl = 30.0
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._workflows: Optional[List[WorkflowInfo]] = None
+        self._by_id: Dict[str, WorkflowInfo] = {}
+        self._fetched_at = 0.0
+
+        # Incrementa a cada listagem armazenada ou invalidação (permite detectar mudanças)
+        self.version = 0
+
+    def _is_fresh(self) -> bool:
+        return self._workflows is not None and (time.monotonic() - self._fetched_at) < self.ttl
+
+    def get(self) -> Optional[List[WorkflowInfo]]:
+        """Retorna a listagem em cache, ou None se expirada/inexistente"""
+        with self._lock:
+            return list(self._workflows) if self._is_fresh() else None
+
+    def fresh_version(self) -> Optional[int]:
+        """Versão da listagem em cache, ou None se expirada/inexistente"""
+        with self._lock:
+            return self.version if self._is_fresh() else None
+
+    def get_by_id(self, workflow_id: str) -> Optional[WorkflowInfo]:
+        """Busca workflow por ID na listagem em cache (None se ausente ou expirada)"""
+        with self._lock:
+            return self._by_id.get(workflow_id) if self._is_fresh() else None
+
+    def has_workflow(self, workflow_id: str) -> Optional[bool]:
+        """Se o ID está na listagem em cache (None se expirada/inexistente)"""
+        with self._lock:
+            return workflow_id in self._by_id if self._is_fresh() else None
+
+    def store(self, workflows: List[WorkflowInfo], since: Optional[int] = None) -> bool:
+        """
+        Armazena uma listagem completa
+        since: versão lida antes de iniciar a listagem; se o cache mudou (ex.: invalidado
+        por um upload em outra thread) a listagem pode estar desatualizada e é descartada
+        """
+        with self._lock:
+            if since is not None and since != self.version:
+                return False
+            self._workflows = list(workflows)
+            self._by_id = {wf.id: wf for wf in self._workflows}
+            self._fetched_at = time.monotonic()
+            self.version += 1
+            return True
+
+    def upsert(self, workflow: WorkflowInfo):
+        """Atualiza/insere um workflow na listagem em cache (após create/update)"""
+        with self._lock:
+            if self._workflows is None:
+                return
+            if workflow.id in self._by_id:
+                self._workflows = [workflow if wf.id == workflow.id else wf for wf in self._workflows]
+            else:
+                self._workflows.append(workflow)
+            self._by_id[workflow.id] = workflow
+            self.version += 1
+
+    def invalidate(self):
+        """Descarta a listagem (após create/update/delete)"""
+        with self._lock:
+            self._workflows = None
+            self._by_id = {}
+            self.version += 1
@@ -0,0 +1,164 @@
+"""
+N8N-DevHub - Workflow Diff
+Diferença estrutural entre duas versões de um workflow (nós, parâmetros e conexões)
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.workflow_hash import (STRUCTURE_FIELDS, VOLATILE_FIELDS, WorkflowFingerprint,
+                                 calculate_workflow_fingerprint, hash_value, keyed_nodes)
+
+
+# Campos do nó comparados sem descer na estrutura (parameters é detalhado campo a campo)
+NODE_IGNORED_FIELDS = frozenset(['id', 'webhookId'])
+
+
+def _value_changes(old: Any, new: Any, path: str, changes: List[Dict]):
+    """Desce em dicionários e registra (caminho, antes, depois) dos valores diferentes"""
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in list(old) + [k for k in new if k not in old]:
+            child = f"{path}.{key}" if path else str(key)
+            if key not in new:
+                changes.append({'path': child, 'old': old[key], 'new': None, 'change': 'removed'})
+            elif key not in old:
+                changes.append({'path': child, 'old': None, 'new': new[key], 'change': 'added'})
+            elif old[key] != new[key] or type(old[key]) is not type(new[key]):
+                _value_changes(old[key], new[key], child, changes)
+    else:
+        changes.append({'path': path, 'old': old, 'new': new, 'change': 'modified'})
+
+
+def _node_changes(old_node: Dict, new_node: Dict) -> List[Dict]:
+    changes = []
+    old_fields = {k: v for k, v in old_node.items() if k not in NODE_IGNORED_FIELDS}
+    new_fields = {k: v for k, v in new_node.items() if k not in NODE_IGNORED_FIELDS}
+    _value_changes(old_fields, new_fields, '', changes)
+    return changes
+
+
+def _edges(source: str, outputs: Any) -> set:
+    """Conexões de uma origem como tuplas (origem, tipo, saída, destino, tipo destino, entrada)"""
+    edges = set()
+    if not isinstance(outputs, dict):
+        return edges
+    for output_type, slots in outputs.items():
+        for output_index, targets in enumerate(slots or []):
+            for target in targets or []:
+                if isinstance(target, dict):
+                    edges.add((source, output_type, output_index, target.get('node'),
+                               target.get('type'), target.get('index')))
+    return edges
+
+
+def _edge_dict(edge: Tuple) -> Dict:
+    source, output_type, output_index, target, target_type, target_index = edge
+    return {'source': source, 'type': output_type, 'output': output_index,
+            'target': target, 'target_type': target_type, 'input': target_index}
+
+
+def _match_renamed(removed: Dict[str, Dict], added: Dict[str, Dict]) -> List[Tuple[str, str]]:
+    """
+    Pareia nós removidos/adicionados do mesmo tipo: primeiro conteúdo idêntico
+    (só o nome mudou), depois o único par restante de cada tipo
+    """
+    pairs = []
+
+    def content_hash(node: Dict) -> str:
+        return hash_value({k: v for k, v in node.items() if k != 'name' and k not in NODE_IGNORED_FIELDS})
+
+    added_by_hash = {}
+    for key, node in added.items():
+        added_by_hash.setdefault(content_hash(node), []).append(key)
+    for key, node in list(removed.items()):
+        candidates = added_by_hash.get(content_hash(node))
+        if candidates:
+            new_key = candidates.pop(0)
+            pairs.append((key, new_key))
+            del removed[key], added[new_key]
+
+    by_type: Dict[Any, Tuple[List[str], List[str]]] = {}
+    for key, node in removed.items():
+        by_type.setdefault(node.get('type'), ([], []))[0].append(key)
+    for key, node in added.items():
+        by_type.setdefault(node.get('type'), ([], []))[1].append(key)
+    for old_keys, new_keys in by_type.values():
+        if len(old_keys) == 1 and len(new_keys) == 1:
+            pairs.append((old_keys[0], new_keys[0]))
+            del removed[old_keys[0]], added[new_keys[0]]
+
+    return pairs
+
+
+def diff_workflows(old: Dict, new: Dict, old_fingerprint: Optional[WorkflowFingerprint] = None,
+                   new_fingerprint: Optional[WorkflowFingerprint] = None) -> Dict:
+    """
+    Diferença estrutural de old para new
+    Nós são alinhados por nome (renomeações detectadas pelo tipo/conteúdo);
+    nós, conexões e settings com hash igual são ignorados sem comparação
+    Returns: {'equal', 'nodes': {'added', 'removed', 'renamed', 'modified'},
+              'connections': {'added', 'removed'}, 'settings', 'fields'}
+    """
+    old_fingerprint = old_fingerprint or calculate_workflow_fingerprint(old)
+    new_fingerprint = new_fingerprint or calculate_workflow_fingerprint(new)
+
+    result = {
+        'equal': old_fingerprint.root == new_fingerprint.root,
+        'nodes': {'added': [], 'removed': [], 'renamed': [], 'modified': []},
+        'connections': {'added': [], 'removed': []},
+        'settings': [],
+        'fields': []
+    }
+    if result['equal']:
+        return result
+
+    # Nós
+    old_nodes = dict(keyed_nodes(old.get('nodes') if isinstance(old.get('nodes'), list) else []))
+    new_nodes = dict(keyed_nodes(new.get('nodes') if isinstance(new.get('nodes'), list) else []))
+    removed = {k: v for k, v in old_nodes.items() if k not in new_nodes and isinstance(v, dict)}
+    added = {k: v for k, v in new_nodes.items() if k not in old_nodes and isinstance(v, dict)}
+
+    pairs = [(k, k) for k in old_nodes if k in new_nodes]
+    for old_key, new_key in _match_renamed(removed, added):
+        result['nodes']['renamed'].append({'old': old_key, 'new': new_key})
+        pairs.append((old_key, new_key))
+
+    for old_key, new_key in pairs:
+        if old_fingerprint.nodes.get(old_key) == new_fingerprint.nodes.get(new_key):
+            continue
+        old_node, new_node = old_nodes[old_key], new_nodes[new_key]
+        if not isinstance(old_node, dict) or not isinstance(new_node, dict):
+            changes = [{'path': '', 'old': old_node, 'new': new_node, 'change': 'modified'}]
+        else:
+            changes = [c for c in _node_changes(old_node, new_node) if c['path'] != 'name']
+        if changes:
+            result['nodes']['modified'].append({
+                'name': new_key,
+                'type': new_node.get('type') if isinstance(new_node, dict) else None,
+                'changes': changes
+            })
+
+    result['nodes']['added'] = sorted(added)
+    result['nodes']['removed'] = sorted(removed)
+
+    # Conexões (apenas origens com hash diferente)
+    old_connections = old.get('connections') if isinstance(old.get('connections'), dict) else {}
+    new_connections = new.get('connections') if isinstance(new.get('connections'), dict) else {}
+    old_edges, new_edges = set(), set()
+    for source in old_connections.keys() | new_connections.keys():
+        if old_fingerprint.connections.get(source) != new_fingerprint.connections.get(source):
+            old_edges |= _edges(source, old_connections.get(source))
+            new_edges |= _edges(source, new_connections.get(source))
+    result['connections']['added'] = [_edge_dict(e) for e in sorted(new_edges - old_edges, key=repr)]
+    result['connections']['removed'] = [_edge_dict(e) for e in sorted(old_edges - new_edges, key=repr)]
+
+    # Settings e demais campos
+    if old_fingerprint.settings != new_fingerprint.settings:
+        _value_changes(old.get('settings') or {}, new.get('settings') or {}, '', result['settings'])
+    if old_fingerprint.other != new_fingerprint.other:
+        # nodes/connections ausentes de um lado e vazias do outro só aparecem aqui
+        ignored = VOLATILE_FIELDS | {k for k in STRUCTURE_FIELDS
+                                     if k == 'settings' or (k in old) == (k in new) or old.get(k) or new.get(k)}
+        _value_changes({k: v for k, v in old.items() if k not in ignored},
+                       {k: v for k, v in new.items() if k not in ignored}, '', result['fields'])
+
+    return result
@@ -0,0 +1,133 @@
+"""
+N8N-DevHub - Workflow Graph
+Dependências entre workflows (nós Execute Workflow) e execução ordenada
+"""
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Set, Tuple
+
+
+# Nós que chamam outro workflow pelo ID
+SUBWORKFLOW_NODE_TYPES = frozenset([
+    'n8n-nodes-base.executeWorkflow',
+    '@n8n/n8n-nodes-langchain.toolWorkflow'
+])
+
+
+def _reference_value(workflow_ref: Any) -> Optional[str]:
+    """Extrai ID de um parâmetro workflowId (string ou resource locator)"""
+    if isinstance(workflow_ref, dict):
+        workflow_ref = workflow_ref.get('value')
+    if isinstance(workflow_ref, str) and workflow_ref and not workflow_ref.startswith('='):
+        return workflow_ref
+    return None
+
+
+def _is_subworkflow_call(node: Any) -> bool:
+    if not isinstance(node, dict) or node.get('type') not in SUBWORKFLOW_NODE_TYPES:
+        return False
+    parameters = node.get('parameters')
+    # source diferente de 'database' aponta para JSON/URL, não para um ID
+    return isinstance(parameters, dict) and parameters.get('source', 'database') == 'database'
+
+
+def get_subworkflow_ids(workflow_data: Dict) -> Set[str]:
+    """Retorna IDs dos workflows chamados por nós Execute Workflow"""
+    ids = set()
+    for node in workflow_data.get('nodes') or []:
+        if _is_subworkflow_call(node):
+            workflow_id = _reference_value(node['parameters'].get('workflowId'))
+            if workflow_id:
+                ids.add(workflow_id)
+    return ids
+
+
+def remap_subworkflow_ids(workflow_data: Dict, id_map: Dict[str, str]) -> Dict:
+    """
+    Substitui referências a sub-workflows conforme id_map (ID antigo -> novo).
+    Retorna uma cópia rasa; o original não é modificado.
+    """
+    nodes = workflow_data.get('nodes')
+    if not id_map or not isinstance(nodes, list):
+        return workflow_data
+
+    changed = False
+    new_nodes = []
+    for node in nodes:
+        if _is_subworkflow_call(node):
+            workflow_ref = node['parameters'].get('workflowId')
+            old_id = _reference_value(workflow_ref)
+            if old_id in id_map:
+                if isinstance(workflow_ref, dict):
+                    workflow_ref = dict(workflow_ref, value=id_map[old_id])
+                else:
+                    workflow_ref = id_map[old_id]
+                node = dict(node, parameters=dict(node['parameters'], workflowId=workflow_ref))
+                changed = True
+        new_nodes.append(node)
+
+    return dict(workflow_data, nodes=new_nodes) if changed else workflow_data
+
+
+def build_dependency_graph(workflows: Dict[Hashable, Dict]) -> Dict[Hashable, Set[Hashable]]:
+    """
+    Monta o grafo de dependências entre workflows locais
+    Recebe {chave: dados} e retorna {chave: chaves dos sub-workflows que ela chama}
+    """
+    key_by_id = {data.get('id'): key for key, data in workflows.items() if data.get('id')}
+
+    graph = {}
+    for key, data in workflows.items():
+        graph[key] = {
+            key_by_id[workflow_id]
+            for workflow_id in get_subworkflow_ids(data)
+            if workflow_id in key_by_id and key_by_id[workflow_id] != key
+        }
+    return graph
+
+
+def run_in_dependency_order(graph: Dict[Hashable, Set[Hashable]], func: Callable,
+                            jobs: int = 1) -> Iterator[Tuple[Hashable, Any, Optional[Exception]]]:
+    """
+    Executa func(chave) respeitando dependências: uma chave só roda depois
+    de todas as suas dependências. Chaves independentes rodam em paralelo.
+    Ciclos são executados ao final, em qualquer ordem.
+    Gera (chave, resultado, exceção) conforme cada execução termina.
+    """
+    remaining = {key: set(deps) for key, deps in graph.items()}
+    dependents: Dict[Hashable, Set[Hashable]] = {key: set() for key in graph}
+    for key, deps in graph.items():
+        for dep in deps:
+            dependents.setdefault(dep, set()).add(key)
+
+    ready = [key for key, deps in remaining.items() if not deps]
+    for key in ready:
+        del remaining[key]
+
+    pending = {}
+    with ThreadPoolExecutor(max_workers=max(1, jobs), thread_name_prefix='devhub-graph') as executor:
+        while ready or pending or remaining:
+            for key in ready:
+                pending[executor.submit(func, key)] = key
+            ready = []
+
+            if not pending:
+                # Só restam ciclos: liberar todos
+                ready = list(remaining)
+                remaining.clear()
+                continue
+
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                key = pending.pop(future)
+                error = future.exception()
+                yield key, (None if error else future.result()), error
+
+                # Liberar dependentes mesmo em caso de erro (o sub-workflow pode já existir no n8n)
+                for parent in dependents.get(key, ()):
+                    deps = remaining.get(parent)
+                    if deps is not None:
+                        deps.discard(key)
+                        if not deps:
+                            del remaining[parent]
+                            ready.append(parent)
@@ -0,0 +1,111 @@
+"""
+N8N-DevHub - Workflow Hash
+Fingerprint normalizado de workflows para detecção de mudanças
+(árvore de Merkle: um hash por nó, por origem de conexões e para settings)
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List
+
+from utils.json_codec import dumps_canonical
+
+
+# Versão do algoritmo (hashes persistidos de outra versão são descartados)
+HASH_VERSION = 4
+
+# Campos que mudam automaticamente no servidor e não representam edição
+VOLATILE_FIELDS = frozenset(['updatedAt', 'createdAt', 'versionId', 'shared'])
+
+# Campos com hash próprio na árvore
+STRUCTURE_FIELDS = frozenset(['nodes', 'connections', 'settings'])
+
+
+@dataclass
+class WorkflowFingerprint:
+    """Hashes de um workflow: por nó (nome), por origem de conexões, settings e demais campos"""
+    root: str
+    nodes: Dict[str, str] = field(default_factory=dict)
+    connections: Dict[str, str] = field(default_factory=dict)
+    settings: str = ''
+    other: str = ''
+
+
+def hash_value(value: Any) -> str:
+    return hashlib.sha256(dumps_canonical(value)).hexdigest()
+
+
+def keyed_nodes(nodes: List) -> Iterable:
+    """(chave, nó): nome do nó; nomes repetidos ou ausentes recebem a posição"""
+    seen = set()
+    for index, node in enumerate(nodes):
+        name = node.get('name') if isinstance(node, dict) else None
+        key = name if isinstance(name, str) and name not in seen else f"{name}#{index}"
+        seen.add(key)
+        yield key, node
+
+
+def calculate_workflow_fingerprint(workflow_data: Dict) -> WorkflowFingerprint:
+    """
+    Calcula o fingerprint hierárquico de um workflow
+    Nós são identificados pelo nome: reordenar o array não altera o hash
+    """
+    nodes = workflow_data.get('nodes')
+    connections = workflow_data.get('connections')
+    structured = {
+        'nodes': isinstance(nodes, list),
+        'connections': isinstance(connections, dict),
+        'settings': True
+    }
+
+    node_hashes = {key: hash_value(node) for key, node in keyed_nodes(nodes if structured['nodes'] else [])}
+
+    connection_hashes = {
+        source: hash_value(targets)
+        for source, targets in (connections.items() if structured['connections'] else ())
+    }
+    settings_hash = hash_value(workflow_data.get('settings'))
+
+    # Demais campos (nome, staticData, ... e estruturas em formato inesperado),
+    # mais quais estruturas existem (campo ausente difere de lista/dict vazio)
+    other_hash = hash_value({
+        'fields': {
+            k: v for k, v in workflow_data.items()
+            if k not in VOLATILE_FIELDS and not (k in STRUCTURE_FIELDS and structured[k])
+        },
+        'present': sorted(k for k in STRUCTURE_FIELDS if k in workflow_data)
+    })
+
+    root = hash_value({
+        'nodes': node_hashes,
+        'connections': connection_hashes,
+        'settings': settings_hash,
+        'other': other_hash
+    })
+    return WorkflowFingerprint(root, node_hashes, connection_hashes, settings_hash, other_hash)
+
+
+def calculate_workflow_hash(workflow_data: Dict) -> str:
+    """Calcula hash de um workflow para detectar mudanças (raiz do fingerprint)"""
+    return calculate_workflow_fingerprint(workflow_data).root
+
+
+def diff_fingerprints(old: WorkflowFingerprint, new: WorkflowFingerprint) -> Dict:
+    """
+    Compara dois fingerprints sem olhar o conteúdo dos workflows
+    Returns: nós adicionados/removidos/modificados, origens de conexões alteradas,
+    e se settings ou os demais campos mudaram
+    """
+    if old.root == new.root:
+        return {'added': [], 'removed': [], 'modified': [], 'connections': [],
+                'settings': False, 'other': False}
+
+    return {
+        'added': sorted(new.nodes.keys() - old.nodes.keys()),
+        'removed': sorted(old.nodes.keys() - new.nodes.keys()),
+        'modified': sorted(k for k in old.nodes.keys() & new.nodes.keys() if old.nodes[k] != new.nodes[k]),
+        'connections': sorted(k for k in old.connections.keys() | new.connections.keys()
+                              if old.connections.get(k) != new.connections.get(k)),
+        'settings': old.settings != new.settings,
+        'other': old.other != new.other
+    }
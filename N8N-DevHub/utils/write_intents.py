@@ -0,0 +1,67 @@
+"""
+N8N-DevHub - Write Intents
+Registro dos arquivos gravados pelo próprio DevHub (supressão de eco no sync)
+"""
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass(frozen=True)
+class WriteIntent:
+    """Identidade do arquivo logo após a gravação"""
+    inode: int
+    mtime_ns: int
+    size: int
+
+
+class WriteIntentRegistry:
+    """
+    Eventos do watchdog para um arquivo que ainda tem o mesmo inode, mtime
+    e tamanho da nossa gravação são ecos e podem ser descartados sem ler o
+    arquivo. Qualquer divergência (edição posterior) invalida o registro.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._intents: Dict[str, WriteIntent] = {}
+        self.echoes_suppressed = 0
+
+    def record(self, filepath: str):
+        """Registra o arquivo recém-gravado (chamar depois da escrita)"""
+        path = os.path.abspath(filepath)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        with self._lock:
+            self._intents[path] = WriteIntent(stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _intact(self, path: str, intent: WriteIntent) -> bool:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size) == (intent.inode, intent.mtime_ns, intent.size)
+
+    def is_echo(self, filepath: str) -> bool:
+        """True se o arquivo continua exatamente como o DevHub o gravou"""
+        path = os.path.abspath(filepath)
+        with self._lock:
+            intent = self._intents.get(path)
+        if intent is None:
+            return False
+
+        echo = self._intact(path, intent)
+        with self._lock:
+            if echo:
+                self.echoes_suppressed += 1
+            elif self._intents.get(path) is intent:
+                del self._intents[path]
+        return echo
+
+    def discard(self, filepath: str):
+        with self._lock:
+            self._intents.pop(os.path.abspath(filepath), None)
@@ -4,13 +4,15 @@ Interface de linha de comando para o N8N-DevHub
 """
 
 import os
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional
 from datetime import datetime
 try:
     from models.workflow_model import WorkflowInfo
+    from utils.local_index import LocalWorkflow
 except ImportError:
     # Fallback se não conseguir importar
     WorkflowInfo = None
+    LocalWorkflow = None
 
 
 class Colors:
@@ -72,23 +74,44 @@ class CLIView:
         print("-" * 80)
         
         for i, wf in enumerate(workflows, 1):
-            status_icon = self._colorize("✓", Colors.GREEN) if wf.active else self._colorize("○", Colors.YELLOW)
-            status_text = self._colorize("Ativo", Colors.GREEN) if wf.active else self._colorize("Inativo", Colors.YELLOW)
-            
-            # Formatear data
-            try:
-                updated = datetime.fromisoformat(wf.updated_at.replace('Z', '+00:00'))
-                updated_str = updated.strftime("%d/%m/%Y %H:%M")
-            except:
-                updated_str = wf.updated_at or "Unknown"
-            
-            print(f"{i:2d}. {status_icon} {self._colorize(wf.name, Colors.WHITE)}")
-            print(f"    ID: {self._colorize(wf.id, Colors.CYAN)}")
-            print(f"    Status: {status_text}")
-            print(f"    Atualizado: {updated_str}")
-            print()
+            self._print_workflow_item(i, wf)
+    
+    def print_workflow_stream(self, workflows: Iterable[WorkflowInfo], title: str = "Workflows") -> int:
+        """Imprime workflows à medida que chegam (total exibido ao final)"""
+        count = 0
+        
+        for count, wf in enumerate(workflows, 1):
+            if count == 1:
+                print(self._colorize(f"\n{title}:", Colors.BOLD))
+                print("-" * 80)
+            self._print_workflow_item(count, wf)
+        
+        if count == 0:
+            print(self._colorize(f"Nenhum workflow encontrado", Colors.YELLOW))
+        else:
+            print(self._colorize(f"Total: {count} workflows", Colors.BOLD))
+        
+        return count
+    
+    def _print_workflow_item(self, index: int, wf: WorkflowInfo):
+        """Imprime um item da lista de workflows"""
+        status_icon = self._colorize("✓", Colors.GREEN) if wf.active else self._colorize("○", Colors.YELLOW)
+        status_text = self._colorize("Ativo", Colors.GREEN) if wf.active else self._colorize("Inativo", Colors.YELLOW)
+        
+        # Formatear data
+        try:
+            updated = datetime.fromisoformat(wf.updated_at.replace('Z', '+00:00'))
+            updated_str = updated.strftime("%d/%m/%Y %H:%M")
+        except:
+            updated_str = wf.updated_at or "Unknown"
+        
+        print(f"{index:2d}. {status_icon} {self._colorize(wf.name, Colors.WHITE)}")
+        print(f"    ID: {self._colorize(wf.id, Colors.CYAN)}")
+        print(f"    Status: {status_text}")
+        print(f"    Atualizado: {updated_str}")
+        print()
     
-    def print_local_workflow_list(self, workflows: List[Dict], title: str = "Workflows Locais"):
+    def print_local_workflow_list(self, workflows: List[LocalWorkflow], title: str = "Workflows Locais"):
         """Imprime lista de workflows locais"""
         if not workflows:
             print(self._colorize(f"Nenhum workflow local encontrado", Colors.YELLOW))
@@ -98,19 +121,15 @@ class CLIView:
         print("-" * 80)
         
         for i, wf in enumerate(workflows, 1):
-            data = wf.get('data', {})
-            status_icon = self._colorize("✓", Colors.GREEN) if data.get('active') else self._colorize("○", Colors.YELLOW)
+            status_icon = self._colorize("✓", Colors.GREEN) if wf.active else self._colorize("○", Colors.YELLOW)
             
-            # Tamanho do arquivo
-            try:
-                size = os.path.getsize(wf['filepath'])
-                size_str = f"{size/1024:.1f}KB" if size > 1024 else f"{size}B"
-            except:
-                size_str = "Unknown"
+            # Tamanho do arquivo (do manifesto)
+            size = wf.size
+            size_str = f"{size/1024:.1f}KB" if size > 1024 else f"{size}B"
             
-            print(f"{i:2d}. {status_icon} {self._colorize(data.get('name', 'Unknown'), Colors.WHITE)}")
-            print(f"    Arquivo: {self._colorize(wf['filename'], Colors.CYAN)}")
-            print(f"    ID: {data.get('id', 'N/A')}")
+            print(f"{i:2d}. {status_icon} {self._colorize(wf.name, Colors.WHITE)}")
+            print(f"    Arquivo: {self._colorize(wf.filename, Colors.CYAN)}")
+            print(f"    ID: {wf.id or 'N/A'}")
             print(f"    Tamanho: {size_str}")
             print()
     
@@ -127,7 +146,7 @@ class CLIView:
         if only_local:
             print(self._colorize(f"📁 Apenas Locais ({len(only_local)}):", Colors.YELLOW))
             for wf in only_local:
-                print(f"  • {wf.get('name', 'Unknown')} ({wf.get('filename', 'N/A')})")
+                print(f"  • {wf.name} ({wf.filename})")
             print()
         
         # Apenas remotos
@@ -144,12 +163,68 @@ class CLIView:
         if in_both:
             print(self._colorize(f"🔄 Em Ambos ({len(in_both)}):", Colors.GREEN))
             for item in in_both:
-                local_wf = item['local']['data']
+                local_wf = item['local']
                 remote_wf = item['remote']
-                sync_status = "🔄" if local_wf.get('updatedAt') != remote_wf.updated_at else "✅"
+                sync_status = "🔄" if local_wf.updated_at != remote_wf.updated_at else "✅"
                 print(f"  {sync_status} {remote_wf.name} ({remote_wf.id})")
             print()
     
+    def print_workflow_diffs(self, results: List[Dict]):
+        """Imprime diferenças estruturais local vs remoto"""
+        self.print_header("Diferenças Local vs Remoto")
+        
+        labels = {
+            'only_local': self._colorize("📁 apenas local", Colors.YELLOW),
+            'only_remote': self._colorize("☁️  apenas remoto", Colors.BLUE)
+        }
+        changed = [r for r in results if r['status'] != 'equal']
+        
+        for result in changed:
+            print(f"{self._colorize(result['name'] or 'N/A', Colors.WHITE)} ({result['id'] or 'sem ID'})")
+            if result['status'] in labels:
+                print(f"  {labels[result['status']]}")
+                print()
+                continue
+            
+            diff = result['diff']
+            nodes = diff['nodes']
+            for name in nodes['added']:
+                print(self._colorize(f"  + nó {name}", Colors.GREEN))
+            for name in nodes['removed']:
+                print(self._colorize(f"  - nó {name}", Colors.RED))
+            for item in nodes['renamed']:
+                print(self._colorize(f"  ~ nó {item['old']} → {item['new']}", Colors.YELLOW))
+            for node in nodes['modified']:
+                print(self._colorize(f"  ~ nó {node['name']}", Colors.YELLOW))
+                for change in node['changes']:
+                    print(f"      {self._format_change(change)}")
+            
+            for edge in diff['connections']['added']:
+                print(self._colorize(f"  + conexão {edge['source']} → {edge['target']}", Colors.GREEN))
+            for edge in diff['connections']['removed']:
+                print(self._colorize(f"  - conexão {edge['source']} → {edge['target']}", Colors.RED))
+            
+            for change in diff['settings']:
+                print(f"  ~ settings {self._format_change(change)}")
+            for change in diff['fields']:
+                print(f"  ~ {self._format_change(change)}")
+            print()
+        
+        equal_count = len(results) - len(changed)
+        print(f"Iguais: {self._colorize(str(equal_count), Colors.GREEN)}  "
+              f"Diferentes: {self._colorize(str(len(changed)), Colors.YELLOW)}")
+    
+    def _format_change(self, change: Dict) -> str:
+        def short(value) -> str:
+            text = repr(value)
+            return text if len(text) <= 60 else text[:57] + "..."
+        
+        if change['change'] == 'added':
+            return f"{change['path']}: + {short(change['new'])}"
+        if change['change'] == 'removed':
+            return f"{change['path']}: - {short(change['old'])}"
+        return f"{change['path']}: {short(change['old'])} → {short(change['new'])}"
+    
     def print_operation_summary(self, success_count: int, total_count: int, 
                               operation: str, error_messages: List[str] = None):
         """Imprime resumo de operação"""
@@ -163,6 +238,40 @@ class CLIView:
             for error in error_messages:
                 print(f"  • {error}")
     
+    def print_progress(self, current: int, total: int, label: str = "", success: bool = True):
+        """Imprime barra de progresso na mesma linha"""
+        width = 30
+        filled = int(width * current / total) if total else width
+        bar = "█" * filled + "░" * (width - filled)
+        icon = self._colorize("✓", Colors.GREEN) if success else self._colorize("✗", Colors.RED)
+        label = label if len(label) <= 40 else label[:37] + "..."
+        
+        print(f"\r[{self._colorize(bar, Colors.CYAN)}] {current}/{total} {icon} {label:<40}", end="", flush=True)
+        if current >= total:
+            print()
+    
+    def print_http_stats(self, stats: Dict):
+        """Imprime estatísticas do pool de conexões HTTP"""
+        print(self._colorize("\nConexões HTTP:", Colors.BOLD))
+        print("-" * 40)
+        print(f"Requisições: {stats['requests_total']} "
+              f"(retries: {stats['retries_total']}, erros: {stats['errors_total']})")
+        print(f"Timeouts: conexão {stats['connect_timeout']:g}s / leitura {stats['read_timeout']:g}s")
+        print(f"Pool por host: {stats['pool_maxsize']} conexões")
+        
+        for pool in stats['pools']:
+            print(f"  • {self._colorize(pool['host'], Colors.CYAN)}: "
+                  f"{pool['connections_opened']} conexões abertas, "
+                  f"{pool['requests']} requisições, "
+                  f"{pool['idle_connections']} ociosas")
+        
+        limiter = stats.get('rate_limiter')
+        if limiter:
+            rate = f"{limiter['rate']:.0f}/{limiter['max_rate']:.0f} req/s" if limiter['rate'] else "sem limite"
+            print(f"Rate limit: {rate}, concorrência {limiter['concurrency']}/{limiter['max_concurrency']} "
+                  f"(throttled: {limiter['throttled_total']})")
+        print()
+    
     def print_connection_info(self, base_url: str, auth_type: str):
         """Imprime informações de conexão"""
         print(f"Conectando em: {self._colorize(base_url, Colors.CYAN)}")
@@ -216,7 +325,8 @@ class CLIView:
         basic_commands = [
             (f"{self._colorize('list', Colors.GREEN)} | {self._colorize('ls', Colors.GREEN)}", "Lista workflows remotos"),
             (f"{self._colorize('list-local', Colors.GREEN)} | {self._colorize('ll', Colors.GREEN)}", "Lista workflows locais"),
-            (f"{self._colorize('status', Colors.GREEN)} | {self._colorize('st', Colors.GREEN)}", "Compara local vs remoto")
+            (f"{self._colorize('status', Colors.GREEN)} | {self._colorize('st', Colors.GREEN)}", "Compara local vs remoto"),
+            (f"{self._colorize('diff', Colors.GREEN)} [nome/id]", "Diferenças de nós e conexões")
         ]
         self._print_section("📋 COMANDOS BÁSICOS", basic_commands)
         
@@ -268,7 +378,10 @@ class CLIView:
             (self._colorize('--inactive', Colors.MAGENTA), "Apenas workflows inativos"),
             (self._colorize('--by-id', Colors.MAGENTA), "Usar ID em vez de nome"),
             (self._colorize('--fuzzy', Colors.MAGENTA), "Busca aproximada (padrão)"),
-            (self._colorize('--exact', Colors.MAGENTA), "Busca exata")
+            (self._colorize('--exact', Colors.MAGENTA), "Busca exata"),
+            (self._colorize('--stats', Colors.MAGENTA), "Estatísticas de conexões HTTP"),
+            (f"{self._colorize('--jobs', Colors.MAGENTA)} N", "Operações em lote em paralelo"),
+            (self._colorize('--json', Colors.MAGENTA), "Saída do diff em JSON")
         ]
         self._print_section("🎛️  FILTROS", filter_commands)
         